@@ -3,9 +3,14 @@ Alembic environment configuration for async SQLAlchemy.
 
 This module configures Alembic to work with the async SQLAlchemy setup
 used by the cooking lab notebook system.
+
+Data migrations that load many rows should use
+``app.models.bulk_copy(op.get_bind(), ...)`` rather than ``op.bulk_insert``;
+on asyncpg it streams the rows with a single binary COPY.
 """
 
 import asyncio
+import functools
 import os
 from logging.config import fileConfig
 from typing import Optional
@@ -15,6 +20,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
+from alembic.runtime.migration import MigrationContext
 
 # Import models to ensure they're registered with Base.metadata
 from app.models import Base
@@ -31,7 +37,8 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
-# for 'autogenerate' support
+# for 'autogenerate' support; its naming_convention is also applied to
+# constraints created through op.create_table() in the revisions
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -40,8 +47,9 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+@functools.lru_cache(maxsize=1)
 def get_database_url() -> str:
-    """Get database URL from environment or config."""
+    """Get database URL from environment or config (resolved once per run)."""
     # Check environment first
     db_url = os.getenv("DATABASE_URL")
     if db_url:
@@ -51,6 +59,28 @@ def get_database_url() -> str:
     return config.get_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./notebook.db")
 
 
+@functools.lru_cache(maxsize=1)
+def get_async_database_url() -> str:
+    """
+    Get the database URL rewritten for an async driver.
+
+    PostgreSQL prefers asyncpg; other explicit drivers (e.g. postgresql+psycopg://)
+    are used as-is.
+    """
+    db_url = get_database_url()
+    if db_url.startswith("sqlite:///"):
+        return db_url.replace("sqlite:///", "sqlite+aiosqlite:///")
+    for prefix in ("postgres://", "postgresql://", "postgresql+psycopg2://"):
+        if db_url.startswith(prefix):
+            return "postgresql+asyncpg://" + db_url[len(prefix):]
+    return db_url
+
+
+def get_current_revision(connection: Connection) -> Optional[str]:
+    """Read the revision stamped in alembic_version (None if unstamped)."""
+    return MigrationContext.configure(connection).get_current_revision()
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -84,50 +114,128 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
-        # Include object name in constraint names for better debugging
-        render_as_batch=True,
+        # Batch (copy-and-move) ALTERs are only needed on SQLite; other
+        # dialects get native ALTER TABLE in autogenerated revisions
+        render_as_batch=connection.dialect.name == "sqlite",
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
+def is_pooled_database(url: str) -> bool:
+    """Whether the database is reached through a transaction pooler."""
+    return "pgbouncer" in url or os.getenv("DATABASE_POOLER") == "1"
+
+
+async def run_async_migrations(skip_if_at: Optional[str] = None) -> None:
     """
     Run migrations in 'online' mode with async engine.
 
     In this scenario we need to create an Engine
     and associate a connection with the context.
-    """
-    # Get database URL
-    db_url = get_database_url()
 
-    # Convert sync URL to async if needed
-    if db_url.startswith("sqlite:///"):
-        db_url = db_url.replace("sqlite:///", "sqlite+aiosqlite:///")
-    elif db_url.startswith("postgresql://"):
-        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
+    Args:
+        skip_if_at: When the database is already stamped with this revision,
+            return after reading alembic_version instead of setting up the
+            migration context
+    """
+    db_url = get_async_database_url()
+    is_sqlite = db_url.startswith("sqlite")
 
     # Create async engine configuration
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = db_url
 
-    # Create async engine
+    # Create async engine. Migrations run sequentially on one connection, so a
+    # single pooled connection is reused for the whole run instead of paying a
+    # fresh connect/auth handshake each time. SQLite gains nothing from pooling.
+    if is_sqlite:
+        pool_options = {"poolclass": pool.NullPool}
+    else:
+        pool_options = {
+            "poolclass": pool.AsyncAdaptedQueuePool,
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_pre_ping": True,
+        }
+
+    # Schema changes invalidate cached prepared statements, and one-shot DDL
+    # never benefits from them, so disable both asyncpg caches for migrations.
+    connect_args = {}
+    if db_url.startswith("postgresql+asyncpg"):
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
+        # Behind a pooler (PgBouncer) the server session may be shared with
+        # other tenants; also skip JIT planning, which one-shot DDL never
+        # amortises. Unique prepared statement names would additionally need
+        # prepared_statement_name_func, which SQLAlchemy 2.0.0 does not support.
+        if is_pooled_database(db_url):
+            connect_args["server_settings"] = {"jit": "off"}
+
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        connect_args=connect_args,
+        **pool_options,
     )
 
     async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
-
+        current = None
+        if skip_if_at is not None:
+            current = await connection.run_sync(get_current_revision)
+            # End the read's implicit transaction so the migrations own theirs
+            await connection.commit()
+        if skip_if_at is None or current != skip_if_at:
+            await connection.run_sync(do_run_migrations)
+
+    # The pooled connections are bound to the loop asyncio.run() is about to
+    # close, so they cannot outlive this call. Long-lived processes that want
+    # to keep a warm connection should pass it in via config.attributes
+    # (see run_migrations_online), which skips creating this engine at all.
     await connectable.dispose()
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    asyncio.run(run_async_migrations())
+    """
+    Run migrations in 'online' mode.
+
+    A caller that already owns an engine and event loop (tests, multi-tenant
+    upgrades, app startup) can hand over a connection to skip building a
+    new loop and engine for every command:
+
+        def upgrade(connection, cfg):
+            cfg.attributes["connection"] = connection
+            command.upgrade(cfg, "head")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(upgrade, alembic_cfg)
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    # A run targeting the single current head is a no-op when the database
+    # is already stamped with it; that is checked against the database
+    # itself, so a deleted, dropped or restored database is still migrated.
+    try:
+        destination = context.get_revision_argument()
+    except KeyError:  # commands such as `current` have no destination
+        destination = None
+    heads = context.get_head_revisions()
+    skip_if_at = heads[0] if len(heads) == 1 and destination == heads[0] else None
+
+    # Prefer uvloop's event loop when available (installed with uvicorn[standard])
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(run_async_migrations(skip_if_at))
 
 
 if context.is_offline_mode():
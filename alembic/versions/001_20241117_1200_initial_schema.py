@@ -5,11 +5,11 @@ Revises:
 Create Date: 2024-11-17 12:00:00.000000
 
 """
-from typing import Sequence, Union
+from typing import Any, Dict, List, Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import BYTEA, JSONB, UUID
 
 # revision identifiers, used by Alembic.
 revision: str = '001_initial_schema'
@@ -17,21 +17,249 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere
+JSON_TYPE = sa.JSON().with_variant(JSONB(), 'postgresql')
+
+# Feedback channels are plain strings restricted by CHECK constraints, so a
+# new channel needs no ALTER TYPE
+CHANNEL_VALUES_SQL = "'slack', 'sms', 'telegram', 'whatsapp', 'signal', 'email', 'web', 'api'"
+
+# Enum types, declared once and shared by every column that uses them
+FEEDBACK_STATUS = sa.Enum('pending', 'processing', 'completed', 'error', 'rejected', name='feedbackstatus')
+
+# Native 16-byte UUID keys on PostgreSQL; CHAR(32) elsewhere. User IDs stay
+# strings because channel webhooks store 12-hex sender pseudonyms in them
+UUID_TYPE = sa.Uuid(as_uuid=False)
+
+# SHA-256 digests as raw 32-byte BYTEA on PostgreSQL; hex strings elsewhere
+HASH_TYPE = sa.String(64).with_variant(BYTEA(), 'postgresql')
+
+# Portable, regex-free shape check for YYYY-MM-DD_slug entry IDs
+ENTRY_ID_CHECK = (
+    "length(id) BETWEEN 12 AND 61 "
+    "AND substr(id, 5, 1) = '-' AND substr(id, 8, 1) = '-' AND substr(id, 11, 1) = '_'"
+)
+
+# Tables whose updated_at column is maintained by a BEFORE/AFTER UPDATE trigger
+TIMESTAMPED_TABLES = ['notebook_entries', 'users', 'feedback']
+
+# Covering columns for the feedback listing indexes (PostgreSQL INCLUDE)
+FEEDBACK_COVER_COLUMNS = ['rating_10', 'channel', 'status', 'is_verified']
+
+# Secondary indexes as (name, table, columns, options), in creation order.
+# Supported options: "where" (partial index predicate), "include"
+# (PostgreSQL covering columns) and "gin" (PostgreSQL-only GIN index using
+# the given operator class; skipped on other dialects).
+INDEXES = [
+    # notebook_entries
+    ('idx_notebook_entries_entry_date', 'notebook_entries', ['entry_date_from_id'], {}),
+    ('idx_notebook_entries_created_at', 'notebook_entries', ['created_at'], {}),
+    ('idx_notebook_entries_updated_at', 'notebook_entries', ['updated_at'], {}),
+    ('idx_notebook_entries_cooking_method', 'notebook_entries', ['cooking_method'], {}),
+    ('idx_notebook_entries_git_commit', 'notebook_entries', ['git_commit_sha'], {}),
+    ('idx_notebook_entries_date_method', 'notebook_entries', ['date', 'cooking_method'], {}),
+    ('idx_notebook_entries_difficulty_servings', 'notebook_entries', ['difficulty_level', 'servings'], {}),
+    ('idx_notebook_entries_rating_10', 'notebook_entries', ['rating_10'], {}),
+    ('idx_notebook_entries_tags', 'notebook_entries', ['tags'], {'gin': 'jsonb_path_ops'}),
+    ('idx_notebook_entries_ai_metadata', 'notebook_entries', ['ai_metadata'], {'gin': 'jsonb_path_ops'}),
+    # users
+    ('idx_users_slack_id', 'users', ['slack_user_id'], {}),
+    ('idx_users_phone_hash', 'users', ['phone_hash'], {}),
+    ('idx_users_email_hash', 'users', ['email_hash'], {}),
+    ('idx_users_telegram_id', 'users', ['telegram_user_id'], {}),
+    ('idx_users_active', 'users', ['id'], {'where': 'is_active'}),
+    ('idx_users_last_feedback', 'users', ['last_feedback_at'], {}),
+    # feedback
+    ('idx_feedback_created_at', 'feedback', ['created_at'], {}),
+    ('idx_feedback_timestamp', 'feedback', ['feedback_timestamp'], {}),
+    ('idx_feedback_rating', 'feedback', ['rating_10'], {}),
+    ('idx_feedback_verified', 'feedback', ['id'], {'where': 'NOT is_verified'}),
+    ('idx_feedback_entry_cover', 'feedback', ['entry_id', 'feedback_timestamp'], {'include': FEEDBACK_COVER_COLUMNS}),
+    ('idx_feedback_user_cover', 'feedback', ['user_id', 'created_at'], {'include': FEEDBACK_COVER_COLUMNS}),
+    ('idx_feedback_status_channel', 'feedback', ['status', 'channel'], {}),
+    ('idx_feedback_active_work', 'feedback', ['feedback_timestamp'], {'where': "status IN ('pending', 'processing') AND retry_count < 5"}),
+    ('idx_feedback_axes', 'feedback', ['axes'], {'gin': 'jsonb_path_ops'}),
+]
+
+
+def _index_ddl(name: str, table: str, columns: List[str], options: Dict[str, Any]) -> str:
+    """Render a PostgreSQL CREATE INDEX statement for an INDEXES entry."""
+    if options.get('gin'):
+        columns = [f"{column} {options['gin']}" for column in columns]
+        return f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING GIN ({', '.join(columns)});"
+    ddl = f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+    if options.get('include'):
+        ddl += f" INCLUDE ({', '.join(options['include'])})"
+    if options.get('where'):
+        ddl += f" WHERE {options['where']}"
+    return ddl + ";"
+
+
+def _create_updated_at_triggers() -> None:
+    """
+    Keep updated_at current with a trigger on each timestamped table.
+
+    PostgreSQL uses a shared BEFORE UPDATE function so the row is stamped in
+    place. SQLite has no NEW assignment, so it re-stamps the row after update
+    unless the statement already set updated_at itself.
+    """
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute(sa.text(
+            "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+            "BEGIN NEW.updated_at = now(); RETURN NEW; END; "
+            "$$ LANGUAGE plpgsql;"
+        ))
+        for table in TIMESTAMPED_TABLES:
+            op.execute(sa.text(
+                f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION set_updated_at();"
+            ))
+    elif op.get_context().dialect.name == 'sqlite':
+        for table in TIMESTAMPED_TABLES:
+            op.execute(sa.text(
+                f"CREATE TRIGGER trg_{table}_updated_at AFTER UPDATE ON {table} "
+                f"FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+                f"BEGIN UPDATE {table} SET updated_at = CURRENT_TIMESTAMP "
+                f"WHERE id = NEW.id; END;"
+            ))
+
+
+def _drop_updated_at_triggers() -> None:
+    """Drop the updated_at triggers (and the PostgreSQL trigger function)."""
+    dialect = op.get_context().dialect.name
+    for table in TIMESTAMPED_TABLES:
+        if dialect == 'postgresql':
+            op.execute(sa.text(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}"))
+        elif dialect == 'sqlite':
+            op.execute(sa.text(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at"))
+    if dialect == 'postgresql':
+        op.execute(sa.text("DROP FUNCTION IF EXISTS set_updated_at()"))
+
+
+def _create_user_stats_triggers() -> None:
+    """
+    Keep users.feedback_count and users.avg_rating current from feedback rows.
+
+    Inserts and deletes adjust the count in place and re-read the average
+    through idx_feedback_user_cover; updates that move feedback between users
+    or change a rating recompute both users' aggregates.
+    """
+    dialect = op.get_context().dialect.name
+    if dialect == 'postgresql':
+        op.execute(sa.text(
+            "CREATE OR REPLACE FUNCTION update_user_feedback_stats() RETURNS trigger AS $$ "
+            "BEGIN "
+            "IF TG_OP = 'INSERT' THEN "
+            "UPDATE users SET feedback_count = feedback_count + 1, "
+            "avg_rating = (SELECT avg(rating_10) FROM feedback WHERE user_id = NEW.user_id) "
+            "WHERE id = NEW.user_id; "
+            "ELSIF TG_OP = 'DELETE' THEN "
+            "UPDATE users SET feedback_count = feedback_count - 1, "
+            "avg_rating = (SELECT avg(rating_10) FROM feedback WHERE user_id = OLD.user_id) "
+            "WHERE id = OLD.user_id; "
+            "ELSE "
+            "UPDATE users SET feedback_count = (SELECT count(*) FROM feedback f WHERE f.user_id = users.id), "
+            "avg_rating = (SELECT avg(f.rating_10) FROM feedback f WHERE f.user_id = users.id) "
+            "WHERE id IN (OLD.user_id, NEW.user_id); "
+            "END IF; "
+            "RETURN NULL; "
+            "END; "
+            "$$ LANGUAGE plpgsql;"
+        ))
+        op.execute(sa.text(
+            "CREATE TRIGGER trg_feedback_user_stats "
+            "AFTER INSERT OR DELETE OR UPDATE OF user_id, rating_10 ON feedback "
+            "FOR EACH ROW EXECUTE FUNCTION update_user_feedback_stats();"
+        ))
+    elif dialect == 'sqlite':
+        op.execute(sa.text(
+            "CREATE TRIGGER trg_feedback_user_stats_insert AFTER INSERT ON feedback "
+            "FOR EACH ROW BEGIN UPDATE users SET feedback_count = feedback_count + 1, "
+            "avg_rating = (SELECT avg(rating_10) FROM feedback WHERE user_id = NEW.user_id) "
+            "WHERE id = NEW.user_id; END;"
+        ))
+        op.execute(sa.text(
+            "CREATE TRIGGER trg_feedback_user_stats_delete AFTER DELETE ON feedback "
+            "FOR EACH ROW BEGIN UPDATE users SET feedback_count = feedback_count - 1, "
+            "avg_rating = (SELECT avg(rating_10) FROM feedback WHERE user_id = OLD.user_id) "
+            "WHERE id = OLD.user_id; END;"
+        ))
+        op.execute(sa.text(
+            "CREATE TRIGGER trg_feedback_user_stats_update AFTER UPDATE OF user_id, rating_10 ON feedback "
+            "FOR EACH ROW BEGIN UPDATE users SET "
+            "feedback_count = (SELECT count(*) FROM feedback f WHERE f.user_id = users.id), "
+            "avg_rating = (SELECT avg(f.rating_10) FROM feedback f WHERE f.user_id = users.id) "
+            "WHERE id IN (OLD.user_id, NEW.user_id); END;"
+        ))
+
+
+def _drop_user_stats_triggers() -> None:
+    """Drop the user statistics triggers (and the PostgreSQL trigger function)."""
+    dialect = op.get_context().dialect.name
+    if dialect == 'postgresql':
+        op.execute(sa.text("DROP TRIGGER IF EXISTS trg_feedback_user_stats ON feedback"))
+        op.execute(sa.text("DROP FUNCTION IF EXISTS update_user_feedback_stats()"))
+    elif dialect == 'sqlite':
+        for event in ('insert', 'delete', 'update'):
+            op.execute(sa.text(f"DROP TRIGGER IF EXISTS trg_feedback_user_stats_{event}"))
+
+
+def _create_indexes() -> None:
+    """
+    Create all secondary indexes.
+
+    On PostgreSQL the statements are sent as a single server-side DO block so
+    the whole batch costs one round-trip; other dialects create them one by one.
+    """
+    if op.get_context().dialect.name == 'postgresql':
+        statements = "\n".join(
+            f"    {_index_ddl(*index)}" for index in INDEXES
+        )
+        op.execute(sa.text(f"DO $$ BEGIN\n{statements}\nEND $$;"))
+    else:
+        for name, table, columns, options in INDEXES:
+            if options.get('gin'):
+                continue
+            kwargs = {}
+            if options.get('where'):
+                kwargs['sqlite_where'] = sa.text(options['where'])
+            op.create_index(name, table, columns, **kwargs)
+
+
+def _drop_indexes() -> None:
+    """
+    Drop all secondary indexes in reverse creation order.
+
+    PostgreSQL accepts a list of indexes in one DROP INDEX statement, so the
+    batch is a single round-trip there as well.
+    """
+    if op.get_context().dialect.name == 'postgresql':
+        names = ", ".join(name for name, *_ in reversed(INDEXES))
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {names}"))
+    else:
+        for name, table, _, options in reversed(INDEXES):
+            if not options.get('gin'):
+                op.drop_index(name, table)
+
 
 def upgrade() -> None:
     """Create initial schema for notebook entries, users, and feedback."""
 
+    # Let PostgreSQL generate UUID keys for rows inserted outside the ORM
+    uuid_default = sa.text('gen_random_uuid()') if op.get_context().dialect.name == 'postgresql' else None
+
     # Create notebook_entries table
     op.create_table(
         'notebook_entries',
-        sa.Column('id', sa.String(100), primary_key=True, comment='Format: YYYY-MM-DD_slug'),
+        sa.Column('id', sa.String(61), primary_key=True, comment='Format: YYYY-MM-DD_slug'),
         sa.Column('version', sa.Integer(), default=1, nullable=False, comment='Schema version for migrations'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('title', sa.String(200), nullable=False, comment='Recipe/cooking session title'),
         sa.Column('date', sa.DateTime(timezone=True), nullable=False, comment='Date of cooking session'),
-        sa.Column('tags', sa.JSON(), default=[], comment='AI-enhanced categorization tags'),
-        sa.Column('gear_ids', sa.JSON(), default=[], comment='References to normalized equipment catalog'),
+        sa.Column('entry_date_from_id', sa.String(10), sa.Computed('substr(id, 1, 10)', persisted=True), comment='YYYY-MM-DD prefix of id, stored at write time for date-range scans'),
+        sa.Column('tags', JSON_TYPE, default=[], comment='AI-enhanced categorization tags'),
+        sa.Column('gear_ids', JSON_TYPE, default=[], comment='References to normalized equipment catalog'),
         sa.Column('servings', sa.Integer(), comment='Number of servings'),
         sa.Column('dinner_time', sa.DateTime(timezone=True), comment='Planned dinner time'),
         sa.Column('cooking_method', sa.String(50), comment='Standardized cooking method vocabulary'),
@@ -39,21 +267,26 @@ def upgrade() -> None:
         sa.Column('prep_time_minutes', sa.Integer(), comment='Preparation time in minutes'),
         sa.Column('cook_time_minutes', sa.Integer(), comment='Cooking time in minutes'),
         sa.Column('total_time_minutes', sa.Integer(), comment='Total time (computed field)'),
-        sa.Column('style_guidelines', sa.JSON(), default={}, comment='Cooking style preferences and guidelines'),
-        sa.Column('ingredients_normalized', sa.JSON(), default=[], comment='Structured ingredient data with AI normalization'),
+        sa.Column('style_guidelines', JSON_TYPE, default={}, comment='Cooking style preferences and guidelines'),
+        sa.Column('ingredients_normalized', JSON_TYPE, default=[], comment='Structured ingredient data with AI normalization'),
         sa.Column('protocol', sa.Text(), comment='Markdown cooking protocol with AI-generated steps'),
-        sa.Column('observations', sa.JSON(), default=[], comment='Time-series observations with AI insights'),
-        sa.Column('outcomes', sa.JSON(), default={}, comment='Results, ratings, and AI recommendations'),
-        sa.Column('scheduling', sa.JSON(), default={}, comment='Make-ahead scheduling and AI-optimized timing'),
-        sa.Column('links', sa.JSON(), default=[], comment='External recipe links and references'),
-        sa.Column('ai_metadata', sa.JSON(), default={}, comment='AI embeddings, similarity scores, and generated content'),
+        sa.Column('observations', JSON_TYPE, default=[], comment='Time-series observations with AI insights'),
+        sa.Column('outcomes', JSON_TYPE, default={}, comment='Results, ratings, and AI recommendations'),
+        sa.Column('scheduling', JSON_TYPE, default={}, comment='Make-ahead scheduling and AI-optimized timing'),
+        sa.Column('links', JSON_TYPE, default=[], comment='External recipe links and references'),
+        sa.Column('ai_metadata', JSON_TYPE, default={}, comment='AI embeddings, similarity scores, and generated content'),
         sa.Column('git_commit_sha', sa.String(40), comment='Git commit SHA for this version'),
-        sa.Column('git_file_path', sa.String(500), comment='Relative path in Git repository'),
-        sa.Column('view_count', sa.Integer(), default=0, nullable=False, comment='Number of times entry has been viewed'),
+        sa.Column('git_file_path', sa.String(255), comment='Relative path in Git repository'),
         sa.Column('success_rate', sa.Float(), comment='Historical success rate for this recipe'),
+        sa.Column('rating_10', sa.Float(), comment="outcomes['rating_10']"),
+        sa.Column('observation_count', sa.Integer(), server_default='0', nullable=False, comment='Number of entries in observations'),
+        sa.Column('last_observation_at', sa.DateTime(timezone=True), comment='Timestamp of the latest observation'),
 
         # Constraints
-        sa.CheckConstraint("id ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}_[a-z0-9-]{1,50}$'", name='valid_entry_id_format'),
+        # Structural ID check only; the full YYYY-MM-DD_slug pattern is validated
+        # by the application, which avoids a regex match per write and keeps
+        # the constraint portable to SQLite.
+        sa.CheckConstraint(ENTRY_ID_CHECK, name='valid_entry_id_format'),
         sa.CheckConstraint("difficulty_level IS NULL OR (difficulty_level >= 1 AND difficulty_level <= 10)", name='valid_difficulty_level'),
         sa.CheckConstraint("prep_time_minutes IS NULL OR prep_time_minutes >= 0", name='positive_prep_time'),
         sa.CheckConstraint("cook_time_minutes IS NULL OR cook_time_minutes >= 0", name='positive_cook_time'),
@@ -61,13 +294,20 @@ def upgrade() -> None:
         sa.CheckConstraint("servings IS NULL OR servings > 0", name='positive_servings'),
     )
 
+    # Create entry_view_counts table (hot counter kept off the wide entry row)
+    op.create_table(
+        'entry_view_counts',
+        sa.Column('entry_id', sa.String(61), sa.ForeignKey('notebook_entries.id', ondelete='CASCADE'), primary_key=True, comment='Reference to notebook entry'),
+        sa.Column('count', sa.BigInteger(), nullable=False, server_default='0', comment='Number of times entry has been viewed'),
+    )
+
     # Create users table
     op.create_table(
         'users',
         sa.Column('id', sa.String(36), primary_key=True, comment='Internal user ID'),
         sa.Column('slack_user_id', sa.String(50), unique=True, comment='Slack user ID'),
-        sa.Column('phone_hash', sa.String(64), unique=True, comment='Hashed phone number for privacy'),
-        sa.Column('email_hash', sa.String(64), unique=True, comment='Hashed email for privacy'),
+        sa.Column('phone_hash', HASH_TYPE, unique=True, comment='Hashed phone number for privacy'),
+        sa.Column('email_hash', HASH_TYPE, unique=True, comment='Hashed email for privacy'),
         sa.Column('telegram_user_id', sa.String(50), unique=True, comment='Telegram user ID'),
         sa.Column('display_name', sa.String(100), comment="User's preferred display name"),
         sa.Column('timezone', sa.String(50), comment="User's timezone for scheduling"),
@@ -75,30 +315,31 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('last_feedback_at', sa.DateTime(timezone=True), comment='Last time user provided feedback'),
-        sa.Column('preferred_channel', sa.Enum('slack', 'sms', 'telegram', 'whatsapp', 'signal', 'email', 'web', 'api', name='feedbackchannel'), comment="User's preferred feedback channel"),
+        sa.Column('preferred_channel', sa.String(16), comment="User's preferred feedback channel"),
         sa.Column('notification_enabled', sa.Boolean(), default=True, nullable=False, comment='Whether to send feedback reminders'),
         sa.Column('feedback_count', sa.Integer(), default=0, nullable=False, comment='Total number of feedback entries'),
         sa.Column('avg_rating', sa.Float(), comment='Average rating given by user'),
+        sa.CheckConstraint(f"preferred_channel IS NULL OR preferred_channel IN ({CHANNEL_VALUES_SQL})", name='valid_preferred_channel'),
     )
 
     # Create feedback table
     op.create_table(
         'feedback',
-        sa.Column('id', sa.String(36), primary_key=True, comment='Unique feedback ID'),
-        sa.Column('entry_id', sa.String(100), sa.ForeignKey('notebook_entries.id', ondelete='CASCADE'), nullable=False, comment='Reference to notebook entry'),
+        sa.Column('id', UUID_TYPE, primary_key=True, server_default=uuid_default, comment='Unique feedback ID'),
+        sa.Column('entry_id', sa.String(61), sa.ForeignKey('notebook_entries.id', ondelete='CASCADE'), nullable=False, comment='Reference to notebook entry'),
         sa.Column('user_id', sa.String(36), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, comment='Reference to user who provided feedback'),
-        sa.Column('channel', sa.Enum('slack', 'sms', 'telegram', 'whatsapp', 'signal', 'email', 'web', 'api', name='feedbackchannel'), nullable=False, comment='Channel through which feedback was collected'),
-        sa.Column('status', sa.Enum('pending', 'processing', 'completed', 'error', 'rejected', name='feedbackstatus'), default='pending', comment='Processing status of feedback'),
+        sa.Column('channel', sa.String(16), nullable=False, comment='Channel through which feedback was collected'),
+        sa.Column('status', FEEDBACK_STATUS, default='pending', comment='Processing status of feedback'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
         sa.Column('feedback_timestamp', sa.DateTime(timezone=True), nullable=False, comment='When the feedback was originally provided'),
         sa.Column('rating_10', sa.Float(), comment='Overall rating on 1-10 scale'),
-        sa.Column('axes', sa.JSON(), default={}, comment='Multi-dimensional rating axes (doneness, salt, smoke, crust, etc.)'),
-        sa.Column('metrics', sa.JSON(), default={}, comment='Quantitative cooking metrics (internal temp, rest time, etc.)'),
+        sa.Column('axes', JSON_TYPE, default={}, comment='Multi-dimensional rating axes (doneness, salt, smoke, crust, etc.)'),
+        sa.Column('metrics', JSON_TYPE, default={}, comment='Quantitative cooking metrics (internal temp, rest time, etc.)'),
         sa.Column('notes', sa.Text(), comment='Free-form feedback notes'),
         sa.Column('raw_input', sa.Text(), comment='Original raw input before normalization'),
-        sa.Column('normalized_data', sa.JSON(), default={}, comment='Normalized feedback data after AI processing'),
-        sa.Column('ai_insights', sa.JSON(), default={}, comment='AI-generated insights and analysis'),
+        sa.Column('normalized_data', JSON_TYPE, default={}, comment='Normalized feedback data after AI processing'),
+        sa.Column('ai_insights', JSON_TYPE, default={}, comment='AI-generated insights and analysis'),
         sa.Column('sentiment_score', sa.Float(), comment='Sentiment analysis score (-1 to 1)'),
         sa.Column('confidence_score', sa.Float(), comment='AI confidence in feedback interpretation'),
         sa.Column('is_verified', sa.Boolean(), default=False, nullable=False, comment='Whether feedback has been verified'),
@@ -110,80 +351,36 @@ def upgrade() -> None:
         sa.CheckConstraint("rating_10 IS NULL OR (rating_10 >= 1 AND rating_10 <= 10)", name='valid_rating_range'),
         sa.CheckConstraint("sentiment_score IS NULL OR (sentiment_score >= -1 AND sentiment_score <= 1)", name='valid_sentiment_range'),
         sa.CheckConstraint("confidence_score IS NULL OR (confidence_score >= 0 AND confidence_score <= 1)", name='valid_confidence_range'),
+        sa.CheckConstraint(f"channel IN ({CHANNEL_VALUES_SQL})", name='valid_channel'),
         sa.CheckConstraint("retry_count >= 0", name='non_negative_retry_count'),
     )
 
-    # Create indexes for notebook_entries
-    op.create_index('idx_notebook_entries_date', 'notebook_entries', ['date'])
-    op.create_index('idx_notebook_entries_created_at', 'notebook_entries', ['created_at'])
-    op.create_index('idx_notebook_entries_updated_at', 'notebook_entries', ['updated_at'])
-    op.create_index('idx_notebook_entries_cooking_method', 'notebook_entries', ['cooking_method'])
-    op.create_index('idx_notebook_entries_difficulty', 'notebook_entries', ['difficulty_level'])
-    op.create_index('idx_notebook_entries_git_commit', 'notebook_entries', ['git_commit_sha'])
-    op.create_index('idx_notebook_entries_date_method', 'notebook_entries', ['date', 'cooking_method'])
-    op.create_index('idx_notebook_entries_difficulty_servings', 'notebook_entries', ['difficulty_level', 'servings'])
-
-    # Create indexes for users
-    op.create_index('idx_users_slack_id', 'users', ['slack_user_id'])
-    op.create_index('idx_users_phone_hash', 'users', ['phone_hash'])
-    op.create_index('idx_users_email_hash', 'users', ['email_hash'])
-    op.create_index('idx_users_telegram_id', 'users', ['telegram_user_id'])
-    op.create_index('idx_users_active', 'users', ['is_active'])
-    op.create_index('idx_users_last_feedback', 'users', ['last_feedback_at'])
-
-    # Create indexes for feedback
-    op.create_index('idx_feedback_entry_id', 'feedback', ['entry_id'])
-    op.create_index('idx_feedback_user_id', 'feedback', ['user_id'])
-    op.create_index('idx_feedback_channel', 'feedback', ['channel'])
-    op.create_index('idx_feedback_status', 'feedback', ['status'])
-    op.create_index('idx_feedback_created_at', 'feedback', ['created_at'])
-    op.create_index('idx_feedback_timestamp', 'feedback', ['feedback_timestamp'])
-    op.create_index('idx_feedback_rating', 'feedback', ['rating_10'])
-    op.create_index('idx_feedback_verified', 'feedback', ['is_verified'])
-    op.create_index('idx_feedback_entry_timestamp', 'feedback', ['entry_id', 'feedback_timestamp'])
-    op.create_index('idx_feedback_user_created', 'feedback', ['user_id', 'created_at'])
-    op.create_index('idx_feedback_status_channel', 'feedback', ['status', 'channel'])
+    # Stamp updated_at in the database on every UPDATE
+    _create_updated_at_triggers()
+
+    # Denormalized per-user feedback aggregates
+    _create_user_stats_triggers()
+
+    # Create secondary indexes
+    _create_indexes()
 
 
 def downgrade() -> None:
     """Drop all tables and indexes."""
 
-    # Drop indexes for feedback
-    op.drop_index('idx_feedback_status_channel', 'feedback')
-    op.drop_index('idx_feedback_user_created', 'feedback')
-    op.drop_index('idx_feedback_entry_timestamp', 'feedback')
-    op.drop_index('idx_feedback_verified', 'feedback')
-    op.drop_index('idx_feedback_rating', 'feedback')
-    op.drop_index('idx_feedback_timestamp', 'feedback')
-    op.drop_index('idx_feedback_created_at', 'feedback')
-    op.drop_index('idx_feedback_status', 'feedback')
-    op.drop_index('idx_feedback_channel', 'feedback')
-    op.drop_index('idx_feedback_user_id', 'feedback')
-    op.drop_index('idx_feedback_entry_id', 'feedback')
-
-    # Drop indexes for users
-    op.drop_index('idx_users_last_feedback', 'users')
-    op.drop_index('idx_users_active', 'users')
-    op.drop_index('idx_users_telegram_id', 'users')
-    op.drop_index('idx_users_email_hash', 'users')
-    op.drop_index('idx_users_phone_hash', 'users')
-    op.drop_index('idx_users_slack_id', 'users')
-
-    # Drop indexes for notebook_entries
-    op.drop_index('idx_notebook_entries_difficulty_servings', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_date_method', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_git_commit', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_difficulty', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_cooking_method', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_updated_at', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_created_at', 'notebook_entries')
-    op.drop_index('idx_notebook_entries_date', 'notebook_entries')
+    # Drop secondary indexes
+    _drop_indexes()
+
+    # Drop triggers
+    _drop_user_stats_triggers()
+    _drop_updated_at_triggers()
 
     # Drop tables
     op.drop_table('feedback')
+    op.drop_table('entry_view_counts')
     op.drop_table('users')
     op.drop_table('notebook_entries')
 
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS feedbackstatus')
-    op.execute('DROP TYPE IF EXISTS feedbackchannel')
\ No newline at end of file
+    # Drop enums (PostgreSQL only; SQLite stores them as VARCHAR + CHECK)
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute('DROP TYPE IF EXISTS feedbackstatus')
\ No newline at end of file
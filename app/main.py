@@ -5,17 +5,19 @@ This module creates and configures the FastAPI application with all necessary
 middleware, routers, error handlers, and startup/shutdown events.
 """
 
-import asyncio
+import functools
+import sys
 import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
+import orjson
 import uvicorn
 
 from .utils.config import get_settings, validate_environment
@@ -27,7 +29,8 @@ from .utils.logging import (
     log_shutdown_info
 )
 from .routers import health, mcp, auth, slack, notifier, feedback, scheduler
-from .middleware.rate_limiting import rate_limit_middleware
+from .middleware.rate_limiting import RateLimitMiddleware
+from .middleware.request_limits import RequestSizeLimitMiddleware, TimeoutMiddleware
 
 
 # Initialize logging first
@@ -113,6 +116,8 @@ def create_app() -> FastAPI:
         version=settings.app.version,
         debug=settings.app.debug,
         lifespan=lifespan,
+        # orjson-backed rendering for every route that returns plain data
+        default_response_class=ORJSONResponse,
         # Custom OpenAPI configuration
         openapi_url="/api/openapi.json" if not settings.app.is_production else None,
         docs_url="/api/docs" if not settings.app.is_production else None,
@@ -150,68 +155,43 @@ def configure_middleware(app: FastAPI, settings) -> None:
             allowed_hosts=["*"]  # Configure with actual allowed hosts in production
         )
 
-    # CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.auth.cors_origins,
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        allow_headers=["*"],
-        max_age=600  # Cache preflight responses for 10 minutes
-    )
-
     # Request logging middleware (custom)
     app.add_middleware(RequestLoggingMiddleware)
 
-    # Rate limiting middleware
-    app.middleware("http")(rate_limit_middleware)
+    # Rate limiting middleware (skipped when the reverse proxy rate limits)
+    if not settings.auth.use_proxy_rate_limit:
+        app.add_middleware(RateLimitMiddleware)
 
     # Request size limiting middleware
-    @app.middleware("http")
-    async def limit_request_size(request: Request, call_next):
-        """Limit request size to prevent abuse."""
-        content_length = request.headers.get("content-length")
-        if content_length:
-            try:
-                size = int(content_length)
-                if size > settings.app.max_request_size:
-                    return JSONResponse(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        content={
-                            "status": "error",
-                            "code": "E_REQUEST_SIZE",
-                            "message": f"Request size too large. Maximum: {settings.app.max_request_size} bytes"
-                        }
-                    )
-            except ValueError:
-                pass
-
-        return await call_next(request)
+    app.add_middleware(
+        RequestSizeLimitMiddleware,
+        max_size=settings.app.max_request_size,
+        validated_max_size=settings.app.validation_max_body_size,
+        validated_prefixes=settings.app.validation_endpoints
+    )
 
     # Request timeout middleware
-    @app.middleware("http")
-    async def timeout_middleware(request: Request, call_next):
-        """Apply request timeout to prevent hanging requests."""
-        try:
-            return await asyncio.wait_for(
-                call_next(request),
-                timeout=settings.app.request_timeout
-            )
-        except asyncio.TimeoutError:
-            logger.warning(
-                "Request timeout",
-                path=request.url.path,
-                method=request.method,
-                timeout=settings.app.request_timeout
-            )
-            return JSONResponse(
-                status_code=status.HTTP_408_REQUEST_TIMEOUT,
-                content={
-                    "status": "error",
-                    "code": "E_TIMEOUT",
-                    "message": f"Request timeout after {settings.app.request_timeout} seconds"
-                }
-            )
+    app.add_middleware(
+        TimeoutMiddleware,
+        timeout=settings.app.request_timeout
+    )
+
+    # CORS middleware - added last so it is outermost and answers preflight
+    # OPTIONS requests before any other middleware runs
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.auth.cors_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=[
+            "Authorization",
+            "Content-Type",
+            "Idempotency-Key",
+            "X-Slack-Signature",
+            "X-Slack-Request-Timestamp",
+        ],
+        max_age=86400  # Cache preflight responses for a day (browsers may cap lower)
+    )
 
 
 def configure_routers(app: FastAPI, settings) -> None:
@@ -243,24 +223,23 @@ def configure_routers(app: FastAPI, settings) -> None:
     # Scheduler endpoints (auth required)
     app.include_router(scheduler.router)
 
-    # Root endpoint
-    @app.get("/", include_in_schema=False)
-    async def root():
-        """Root endpoint providing basic API information."""
-        return {
+    # The root and info payloads only depend on settings, so they are encoded
+    # on first use and served as bytes instead of going through
+    # jsonable_encoder on every request
+    @functools.lru_cache(maxsize=None)
+    def root_body() -> bytes:
+        return orjson.dumps({
             "name": settings.app.name,
             "version": settings.app.version,
             "environment": settings.app.environment,
             "status": "operational",
             "docs_url": "/api/docs" if not settings.app.is_production else None,
             "health_url": "/health"
-        }
+        })
 
-    # API info endpoint
-    @app.get("/api/info", include_in_schema=False)
-    async def api_info():
-        """API information endpoint."""
-        return {
+    @functools.lru_cache(maxsize=None)
+    def api_info_body() -> bytes:
+        return orjson.dumps({
             "name": settings.app.name,
             "version": settings.app.version,
             "description": settings.app.description,
@@ -274,7 +253,34 @@ def configure_routers(app: FastAPI, settings) -> None:
                 "scheduler": "/scheduler",
                 "docs": "/api/docs" if not settings.app.is_production else None
             }
-        }
+        })
+
+    # Root endpoint
+    @app.get("/", include_in_schema=False)
+    async def root():
+        """Root endpoint providing basic API information."""
+        return Response(content=root_body(), media_type="application/json")
+
+    # API info endpoint
+    @app.get("/api/info", include_in_schema=False)
+    async def api_info():
+        """API information endpoint."""
+        return Response(content=api_info_body(), media_type="application/json")
+
+
+@functools.lru_cache(maxsize=256)
+def encode_error(code: str, message: str) -> bytes:
+    """Encode a standard error body; repeated errors reuse the cached bytes."""
+    return orjson.dumps({"status": "error", "code": code, "message": message})
+
+
+def error_response(status_code: int, code: str, message: str) -> Response:
+    """Build a standard error response without a per-request JSON encode."""
+    return Response(
+        content=encode_error(code, message),
+        status_code=status_code,
+        media_type="application/json"
+    )
 
 
 def configure_error_handlers(app: FastAPI, settings) -> None:
@@ -285,6 +291,8 @@ def configure_error_handlers(app: FastAPI, settings) -> None:
         app: FastAPI application instance
         settings: Application settings
     """
+    # Settings are fixed for the process lifetime; read once at setup
+    hide_error_details = settings.app.is_production
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
@@ -299,19 +307,14 @@ def configure_error_handlers(app: FastAPI, settings) -> None:
 
         # If detail is already a dict (from our error responses), use it directly
         if isinstance(exc.detail, dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=exc.status_code,
                 content=exc.detail
             )
 
         # Otherwise, wrap it in our standard error format
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "status": "error",
-                "code": f"HTTP_{exc.status_code}",
-                "message": str(exc.detail)
-            }
+        return error_response(
+            exc.status_code, f"HTTP_{exc.status_code}", str(exc.detail)
         )
 
     @app.exception_handler(ValueError)
@@ -324,14 +327,7 @@ def configure_error_handlers(app: FastAPI, settings) -> None:
             method=request.method
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "status": "error",
-                "code": "E_SCHEMA",
-                "message": str(exc)
-            }
-        )
+        return error_response(status.HTTP_400_BAD_REQUEST, "E_SCHEMA", str(exc))
 
     @app.exception_handler(FileNotFoundError)
     async def file_not_found_handler(request: Request, exc: FileNotFoundError):
@@ -343,13 +339,8 @@ def configure_error_handlers(app: FastAPI, settings) -> None:
             method=request.method
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={
-                "status": "error",
-                "code": "E_NOT_FOUND",
-                "message": "Resource not found"
-            }
+        return error_response(
+            status.HTTP_404_NOT_FOUND, "E_NOT_FOUND", "Resource not found"
         )
 
     @app.exception_handler(Exception)
@@ -365,18 +356,13 @@ def configure_error_handlers(app: FastAPI, settings) -> None:
         )
 
         # Don't expose internal error details in production
-        if settings.app.is_production:
+        if hide_error_details:
             message = "An internal error occurred"
         else:
             message = str(exc)
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "status": "error",
-                "code": "E_INTERNAL",
-                "message": message
-            }
+        return error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, "E_INTERNAL", message
         )
 
 
@@ -441,6 +427,23 @@ def configure_openapi(app: FastAPI, settings) -> None:
 
     app.openapi = custom_openapi
 
+    if app.openapi_url:
+        # The schema never changes after startup, so serve it as bytes encoded
+        # once rather than re-encoding the whole dict on every request
+        openapi_bytes = None
+
+        async def openapi_json(request: Request) -> Response:
+            nonlocal openapi_bytes
+            if openapi_bytes is None:
+                openapi_bytes = orjson.dumps(app.openapi())
+            return Response(content=openapi_bytes, media_type="application/json")
+
+        app.router.routes = [
+            route for route in app.router.routes
+            if getattr(route, "path", None) != app.openapi_url
+        ]
+        app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+
 
 # Create the application instance
 app = create_app()
@@ -451,7 +454,8 @@ def run_server():
     Run the development server.
 
     This function is used for development and testing.
-    In production, use a proper ASGI server like Gunicorn + Uvicorn.
+    In production, use a proper ASGI server like Gunicorn + Uvicorn, keeping
+    the C event loop and HTTP parser (``--loop uvloop --http httptools``).
     """
     settings = get_settings()
 
@@ -462,6 +466,8 @@ def run_server():
         port=settings.app.port,
         log_level=settings.logging.level.lower(),
         reload=settings.app.is_development,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         access_log=False,  # We handle logging with our middleware
         server_header=False,  # Don't expose server info
         date_header=False  # Don't include date header
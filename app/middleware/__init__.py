@@ -1,5 +1,6 @@
 """Middleware package for the MCP Cooking Lab Notebook."""
 
-from .rate_limiting import rate_limit_middleware
+from .rate_limiting import RateLimitMiddleware
+from .request_limits import RequestSizeLimitMiddleware, TimeoutMiddleware
 
-__all__ = ["rate_limit_middleware"]
\ No newline at end of file
+__all__ = ["RateLimitMiddleware", "RequestSizeLimitMiddleware", "TimeoutMiddleware"]
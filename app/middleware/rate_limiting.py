@@ -5,42 +5,71 @@ Implements sliding window rate limiting to prevent abuse
 following PROMPT.md Step 1.5 specifications.
 """
 
+import json
 import time
-from collections import defaultdict
-from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from collections import OrderedDict, deque
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Paths exempt from rate limiting (health probes). "/health" redirects to
+# "/health/", where the health router actually serves the full check.
+_SKIP_PATHS = frozenset({"/health", "/health/", "/health/live", "/health/ready"})
+
+# The 429 response never varies, so it is encoded once at import time
+_429_BODY = json.dumps(
+    {
+        "status": "error",
+        "code": "E_RATE_LIMIT",
+        "message": "Rate limit exceeded. Please try again later."
+    },
+    separators=(",", ":"),
+).encode()
+_429_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_429_BODY)).encode()),
+]
+
 
 class RateLimiter:
     """Simple in-memory rate limiter for family-scale usage."""
 
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(self, requests_per_minute: int = 60, max_clients: int = 10_000):
         self.requests_per_minute = requests_per_minute
-        self.requests = defaultdict(list)
+        self.max_clients = max_clients
+        # Per-IP request times, oldest first; never holds more than the limit.
+        # Kept in least-recently-seen order so memory stays bounded however
+        # many distinct IPs show up.
+        self.requests: "OrderedDict[str, deque]" = OrderedDict()
 
     def is_allowed(self, client_ip: str) -> bool:
         """Check if request is allowed based on rate limit."""
         now = time.time()
         minute_ago = now - 60
-
-        # Clean old requests
-        self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
-            if req_time > minute_ago
-        ]
+        window = self.requests.get(client_ip)
+        if window is None:
+            window = self.requests[client_ip] = deque(maxlen=self.requests_per_minute)
+            if len(self.requests) > self.max_clients:
+                self.requests.popitem(last=False)
+        else:
+            self.requests.move_to_end(client_ip)
+
+        # Drop requests that have left the window (amortised O(1))
+        while window and window[0] <= minute_ago:
+            window.popleft()
 
         # Check current request count
-        if len(self.requests[client_ip]) >= self.requests_per_minute:
+        if len(window) >= self.requests_per_minute:
             logger.warning("Rate limit exceeded",
                          client_ip=client_ip,
-                         requests=len(self.requests[client_ip]))
+                         requests=len(window))
             return False
 
         # Add current request
-        self.requests[client_ip].append(now)
+        window.append(now)
         return True
 
 
@@ -48,24 +77,28 @@ class RateLimiter:
 rate_limiter = RateLimiter(requests_per_minute=120)  # Allow 120 requests per minute for family
 
 
-async def rate_limit_middleware(request: Request, call_next):
-    """Rate limiting middleware."""
-    client_ip = request.client.host if request.client else "unknown"
+class RateLimitMiddleware:
+    """Pure ASGI middleware applying the global per-IP rate limiter."""
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter = rate_limiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-    # Skip rate limiting for health checks
-    if request.url.path in ["/health", "/health/live", "/health/ready"]:
-        response = await call_next(request)
-        return response
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
-    if not rate_limiter.is_allowed(client_ip):
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "status": "error",
-                "code": "E_RATE_LIMIT",
-                "message": "Rate limit exceeded. Please try again later."
-            }
-        )
+        if not self.limiter.is_allowed(client_ip):
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": _429_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _429_BODY})
+            return
 
-    response = await call_next(request)
-    return response
\ No newline at end of file
+        await self.app(scope, receive, send)
@@ -0,0 +1,145 @@
+"""
+Request size and timeout limits as pure ASGI middleware.
+
+Unlike ``@app.middleware("http")`` functions, these do not run each request
+through Starlette's BaseHTTPMiddleware (extra task, Request/Response objects
+and a memory stream for the body); they wrap the ASGI callable directly.
+"""
+
+import asyncio
+import json
+from typing import Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+def _error_body(code: str, message: str) -> bytes:
+    """Encode a standard error payload once, for reuse on every rejection."""
+    return json.dumps(
+        {"status": "error", "code": code, "message": message},
+        separators=(",", ":"),
+    ).encode()
+
+
+async def _send_error(send: Send, status_code: int, body: bytes) -> None:
+    """Send a complete JSON error response."""
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": JSON_HEADERS + [(b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject requests whose Content-Length exceeds ``max_size`` with 413.
+
+    Paths starting with one of ``validated_prefixes`` are held to the smaller
+    ``validated_max_size``, since their bodies are parsed into pydantic models.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_size: int,
+        validated_max_size: Optional[int] = None,
+        validated_prefixes: Sequence[str] = (),
+    ):
+        self.app = app
+        self.max_size = max_size
+        self.validated_max_size = min(validated_max_size or max_size, max_size)
+        self.validated_prefixes = tuple(validated_prefixes)
+        self.error_body = _error_body(
+            "E_REQUEST_SIZE",
+            f"Request size too large. Maximum: {max_size} bytes",
+        )
+        self.validated_error_body = _error_body(
+            "E_REQUEST_SIZE",
+            f"Request size too large. Maximum: {self.validated_max_size} bytes",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    size = int(value)
+                except ValueError:
+                    break
+                if size > self.validated_max_size:
+                    if size > self.max_size:
+                        await _send_error(send, 413, self.error_body)
+                        return
+                    if scope["path"].startswith(self.validated_prefixes):
+                        await _send_error(send, 413, self.validated_error_body)
+                        return
+                break
+
+        await self.app(scope, receive, send)
+
+
+class TimeoutMiddleware:
+    """Answer with 408 when a request takes longer than ``timeout`` seconds."""
+
+    def __init__(self, app: ASGIApp, timeout: float):
+        self.app = app
+        self.timeout = timeout
+        self.error_body = _error_body(
+            "E_TIMEOUT",
+            f"Request timeout after {timeout} seconds",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # A bare loop timer that cancels this task, rather than a timeout
+        # context manager or an extra task per request (asyncio.wait_for)
+        task = asyncio.current_task()
+        timed_out = False
+
+        def expire() -> None:
+            nonlocal timed_out
+            timed_out = True
+            task.cancel()
+
+        handle = asyncio.get_running_loop().call_later(self.timeout, expire)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except asyncio.CancelledError:
+            # Cancellation from elsewhere (e.g. server shutdown) propagates
+            if not timed_out:
+                raise
+            if hasattr(task, "uncancel"):  # Python 3.11+
+                task.uncancel()
+            logger.warning(
+                "Request timeout",
+                path=scope["path"],
+                method=scope["method"],
+                timeout=self.timeout
+            )
+            # Once headers are out the status can no longer be changed
+            if response_started:
+                raise asyncio.TimeoutError() from None
+            await _send_error(send, 408, self.error_body)
+        finally:
+            handle.cancel()
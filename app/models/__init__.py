@@ -7,7 +7,9 @@ and database initialization functions for the cooking lab notebook system.
 
 import os
 import logging
-from typing import AsyncGenerator, Optional
+import re
+import time
+from typing import Any, AsyncGenerator, Iterable, Optional, Sequence
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import (
@@ -15,16 +17,20 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import StaticPool
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy import event, column, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+import orjson
 
-from .notebook import Base, NotebookEntry
+from .notebook import Base, NotebookEntry, EntryViewCount
 from .feedback import User, Feedback, FeedbackChannel, FeedbackStatus
 
 # Re-export models for convenience
 __all__ = [
     "Base",
     "NotebookEntry",
+    "EntryViewCount",
     "User",
     "Feedback",
     "FeedbackChannel",
@@ -32,12 +38,53 @@ __all__ = [
     "DatabaseManager",
     "get_database_manager",
     "get_session",
+    "get_db",
+    "read_session",
     "init_database",
-    "close_database"
+    "close_database",
+    "bulk_copy"
 ]
 
 logger = logging.getLogger(__name__)
 
+# Credentials between the scheme and the host, masked for logging
+_MASK_RE = re.compile(r"://[^@]+@")
+
+# Family-scale pool: sized to the host rather than worst-case concurrency, so
+# idle connections don't hold PostgreSQL backend memory
+DEFAULT_POOL_SIZE = min((os.cpu_count() or 1) * 2, 8)
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson instead of the stdlib."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Standard SQLite throughput settings: WAL with NORMAL sync batches fsyncs
+# instead of paying one per commit
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+class WriteTrackingSession(Session):
+    """Session that records in ``info["has_writes"]`` whether it wrote anything."""
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _mark_flush(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _mark_statement(orm_execute_state):
+    # Anything that is not a SELECT (including text()) counts as a write
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
 
 class DatabaseManager:
     """
@@ -47,61 +94,96 @@ class DatabaseManager:
     operations with proper error handling and resource cleanup.
     """
 
-    def __init__(self, database_url: str, echo: bool = False):
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        read_database_url: Optional[str] = None,
+    ):
         """
         Initialize the database manager.
 
         Args:
             database_url: Database connection URL
             echo: Whether to echo SQL statements for debugging
+            read_database_url: Optional URL for read-only sessions (e.g. a
+                replica); defaults to ``database_url``
         """
         self.database_url = database_url
+        self.read_database_url = read_database_url or database_url
+        self.masked_url = self._mask_url(database_url)
         self.echo = echo
         self.engine: Optional[AsyncEngine] = None
+        self.read_engine: Optional[AsyncEngine] = None
         self.session_maker: Optional[async_sessionmaker] = None
+        self.read_session_maker: Optional[async_sessionmaker] = None
 
-    async def initialize(self) -> None:
-        """Initialize the database engine and session maker."""
-        if self.engine is not None:
-            logger.warning("Database manager already initialized")
-            return
-
-        # Configure engine with connection pooling
-        connect_args = {}
-
+    def _create_engine(self, database_url: str) -> AsyncEngine:
+        """Create an engine with the pool and driver settings for ``database_url``."""
         # Special handling for SQLite (development/testing)
-        if self.database_url.startswith("sqlite"):
-            connect_args = {
-                "check_same_thread": False,
-                "timeout": 30,
+        if database_url.startswith("sqlite"):
+            engine_options = {
+                "connect_args": {
+                    "check_same_thread": False,
+                    "timeout": 30,
+                },
+                # Use StaticPool for SQLite to maintain connections
+                "poolclass": StaticPool,
             }
-            # Use StaticPool for SQLite to maintain connections
-            poolclass = StaticPool
         else:
-            # PostgreSQL production configuration
-            poolclass = None
+            # PostgreSQL production configuration; fail fast rather than
+            # queue behind an overfilled pool
+            engine_options = {
+                "pool_size": DEFAULT_POOL_SIZE,
+                "max_overflow": 0,
+                "pool_timeout": 5,
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,  # Recycle connections after 30 minutes
+                # Reuse the most recently returned connection, so a few stay
+                # warm and the rest sit idle until recycled
+                "pool_use_lifo": True,
+            }
 
-        self.engine = create_async_engine(
-            self.database_url,
+        engine = create_async_engine(
+            database_url,
             echo=self.echo,
             future=True,
-            connect_args=connect_args,
-            poolclass=poolclass,
-            # Connection pool settings for PostgreSQL
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            **engine_options,
         )
 
-        # Enable foreign key constraints for SQLite
-        if self.database_url.startswith("sqlite"):
-            @event.listens_for(self.engine.sync_engine, "connect")
+        # Enable foreign key constraints and WAL for SQLite
+        if database_url.startswith("sqlite"):
+            # SQLite's updated_at trigger runs AFTER UPDATE, which RETURNING
+            # does not see; a post-flush SELECT picks up the stamped value
+            engine.sync_engine.dialect.update_returning = False
+
+            @event.listens_for(engine.sync_engine, "connect")
             def set_sqlite_pragma(dbapi_connection, connection_record):
                 cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
+                for pragma in SQLITE_PRAGMAS:
+                    cursor.execute(pragma)
                 cursor.close()
 
+        return engine
+
+    async def initialize(self) -> None:
+        """Initialize the database engines and session makers."""
+        if self.engine is not None:
+            logger.warning("Database manager already initialized")
+            return
+
+        self.engine = self._create_engine(self.database_url)
+
+        # Reads get their own pool (and optionally their own server), so a
+        # burst of dashboard/search queries can't exhaust the connections
+        # feedback ingestion needs. SQLite shares its single connection.
+        if self.database_url.startswith("sqlite") and self.read_database_url == self.database_url:
+            self.read_engine = self.engine
+        else:
+            self.read_engine = self._create_engine(self.read_database_url)
+
         # Create session maker
         self.session_maker = async_sessionmaker(
             bind=self.engine,
@@ -109,9 +191,23 @@ class DatabaseManager:
             expire_on_commit=False,
             autoflush=True,
             autocommit=False,
+            sync_session_class=WriteTrackingSession,
         )
 
-        logger.info(f"Database manager initialized with URL: {self._mask_url(self.database_url)}")
+        if self.read_engine is self.engine:
+            # SQLite's single shared connection must keep its isolation level,
+            # so reads use ordinary sessions
+            self.read_session_maker = self.session_maker
+        else:
+            # Read-only sessions run in autocommit mode: no BEGIN/COMMIT round trips
+            self.read_session_maker = async_sessionmaker(
+                bind=self.read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+
+        logger.info(f"Database manager initialized with URL: {self.masked_url}")
 
     async def create_tables(self) -> None:
         """Create all database tables."""
@@ -147,7 +243,10 @@ class DatabaseManager:
         async with self.session_maker() as session:
             try:
                 yield session
-                await session.commit()
+                # Read-only work needs no COMMIT; close() ends its transaction
+                if (session.new or session.dirty or session.deleted
+                        or session.info.get("has_writes")):
+                    await session.commit()
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Database session error: {e}")
@@ -155,37 +254,74 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get a session for read-only work.
+
+        On server databases statements run in autocommit mode, so each one
+        sees its own snapshot and nothing is ever committed; SQLite uses an
+        ordinary session on its shared connection. Use get_session() for
+        anything that writes or needs a consistent view across statements.
+
+        Yields:
+            AsyncSession: Database session
+        """
+        if self.read_session_maker is None:
+            raise RuntimeError("Database manager not initialized")
+
+        async with self.read_session_maker() as session:
+            yield session
+
     async def close(self) -> None:
         """Close the database engine and clean up resources."""
         if self.engine is not None:
+            if self.read_engine is not self.engine:
+                await self.read_engine.dispose()
             await self.engine.dispose()
             self.engine = None
+            self.read_engine = None
             self.session_maker = None
+            self.read_session_maker = None
             logger.info("Database connection closed")
 
     def _mask_url(self, url: str) -> str:
         """Mask sensitive information in database URL for logging."""
-        if "://" in url:
-            protocol, rest = url.split("://", 1)
-            if "@" in rest:
-                credentials, host_part = rest.split("@", 1)
-                return f"{protocol}://***@{host_part}"
-        return url
+        return _MASK_RE.sub("://***@", url, count=1)
 
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
 
 
+# Synchronous or bare URL schemes rewritten to their async drivers. PostgreSQL
+# always goes through asyncpg: a native async binary protocol, where aiosqlite
+# and sync drivers hop to a worker thread for every statement.
+_ASYNC_DRIVER_PREFIXES = (
+    ("postgres://", "postgresql+asyncpg://"),
+    ("postgresql://", "postgresql+asyncpg://"),
+    ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+    ("sqlite:///", "sqlite+aiosqlite:///"),
+)
+
+
+def _to_async_url(database_url: str) -> str:
+    """Rewrite a sync-driver or bare database URL to its async driver."""
+    for prefix, async_prefix in _ASYNC_DRIVER_PREFIXES:
+        if database_url.startswith(prefix):
+            return async_prefix + database_url[len(prefix):]
+    return database_url
+
+
 def get_database_url() -> str:
     """
     Get the database URL from environment variables.
 
+    Hosting providers commonly hand out ``postgres://`` or sync-driver URLs;
+    these are rewritten to the asyncpg (or aiosqlite) equivalent.
+
     Returns:
         Database connection URL
-
-    Raises:
-        ValueError: If DATABASE_URL is not set
     """
     database_url = os.getenv("DATABASE_URL")
     if not database_url:
@@ -193,7 +329,18 @@ def get_database_url() -> str:
         database_url = "sqlite+aiosqlite:///./notebook.db"
         logger.warning("DATABASE_URL not set, using default SQLite database")
 
-    return database_url
+    return _to_async_url(database_url)
+
+
+def get_read_database_url() -> Optional[str]:
+    """
+    Get the optional read-only database URL (e.g. a replica).
+
+    Returns:
+        DATABASE_READ_URL rewritten for an async driver, or None when unset
+    """
+    read_url = os.getenv("DATABASE_READ_URL")
+    return _to_async_url(read_url) if read_url else None
 
 
 def get_database_manager() -> DatabaseManager:
@@ -234,10 +381,12 @@ async def init_database(
         logger.warning("Database already initialized")
         return _db_manager
 
+    read_database_url = None
     if database_url is None:
         database_url = get_database_url()
+        read_database_url = get_read_database_url()
 
-    _db_manager = DatabaseManager(database_url, echo)
+    _db_manager = DatabaseManager(database_url, echo, read_database_url)
     await _db_manager.initialize()
 
     if create_tables:
@@ -272,6 +421,71 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency yielding a session from the global manager.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    async with get_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a read-only (autocommit) session from the global manager.
+
+    Yields:
+        AsyncSession: Database session
+
+    Raises:
+        RuntimeError: If database manager is not initialized
+    """
+    db_manager = get_database_manager()
+    async with db_manager.read_session() as session:
+        yield session
+
+
+def bulk_copy(
+    connection: Connection,
+    table_name: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> None:
+    """
+    Bulk-load rows into a table, using asyncpg's binary COPY when available.
+
+    Takes a synchronous Connection so it can be called from an Alembic data
+    migration (``bulk_copy(op.get_bind(), ...)``) or from async code via
+    ``await conn.run_sync(bulk_copy, ...)``. Other drivers fall back to a
+    single executemany INSERT.
+
+    Args:
+        connection: Connection inside the caller's transaction
+        table_name: Target table name
+        columns: Column names, in the same order as each record
+        records: Row tuples to insert
+    """
+    if connection.dialect.driver == "asyncpg":
+        adapted = connection.connection.dbapi_connection
+        # COPY bypasses the DBAPI cursor, so open the driver transaction first
+        if not getattr(adapted, "_started", True):
+            connection.exec_driver_sql("SELECT 1")
+        await_only(
+            adapted.driver_connection.copy_records_to_table(
+                table_name, columns=list(columns), records=records
+            )
+        )
+        return
+
+    rows = [dict(zip(columns, record)) for record in records]
+    if rows:
+        target = table(table_name, *(column(name) for name in columns))
+        connection.execute(target.insert(), rows)
+
+
 # Database lifecycle context manager for applications
 @asynccontextmanager
 async def database_lifespan(
@@ -319,28 +533,44 @@ def validate_database_config() -> dict:
 
 
 # Health check function
+# Probes arriving within this many seconds of the last real ping reuse its result
+HEALTH_CHECK_INTERVAL = 5.0
+_last_health_check: Optional[tuple] = None  # (monotonic time, result)
+
+
 async def check_database_health() -> dict:
     """
     Check database connectivity and return health status.
 
+    Pings the database over a plain pooled connection (no session or
+    transaction), at most once every HEALTH_CHECK_INTERVAL seconds.
+
     Returns:
         Dict containing health check results
     """
+    global _last_health_check
+    now = time.monotonic()
+    if _last_health_check is not None and now - _last_health_check[0] < HEALTH_CHECK_INTERVAL:
+        return _last_health_check[1]
+
     try:
         db_manager = get_database_manager()
-        async with db_manager.get_session() as session:
+        async with db_manager.engine.connect() as conn:
             # Simple query to test connectivity
-            result = await session.execute("SELECT 1")
-            result.fetchone()
+            await conn.scalar(text("SELECT 1"))
 
-        return {
+        result = {
             "status": "healthy",
-            "database_url": db_manager._mask_url(db_manager.database_url),
-            "engine_pool_size": db_manager.engine.pool.size() if db_manager.engine else 0,
+            "database_url": db_manager.masked_url,
+            # StaticPool (SQLite) has a single connection and no size()
+            "engine_pool_size": getattr(db_manager.engine.pool, "size", lambda: 1)(),
         }
     except Exception as e:
-        return {
+        result = {
             "status": "unhealthy",
             "error": str(e),
-            "database_url": db_manager._mask_url(db_manager.database_url) if _db_manager else "not_initialized",
-        }
\ No newline at end of file
+            "database_url": db_manager.masked_url if _db_manager else "not_initialized",
+        }
+
+    _last_health_check = (now, result)
+    return result
@@ -7,19 +7,23 @@ for ratings, metrics, and user tracking.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from enum import Enum
 
 from sqlalchemy import (
-    Boolean, DateTime, Float, Integer, String, Text, JSON,
-    Index, CheckConstraint, ForeignKey, Enum as SQLEnum
+    Boolean, DateTime, Float, Integer, String, Table, Text, Uuid, DDL, event,
+    Index, CheckConstraint, ForeignKey, Enum as SQLEnum, case, cast, insert, literal,
+    select, text, update, FetchedValue, TypeDecorator
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import BYTEA, JSON as PG_JSON, UUID, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+import orjson
 import uuid
 
-from .notebook import Base
+from .notebook import Base, JSONType, add_updated_at_trigger
 
 
 class FeedbackChannel(str, Enum):
@@ -34,6 +38,88 @@ class FeedbackChannel(str, Enum):
     API = "api"
 
 
+# Native 16-byte UUID on PostgreSQL (CHAR(32) elsewhere), read and written as
+# the usual hyphenated string. Only for keys that are always generated UUIDs:
+# user IDs stay strings, since channel webhooks use 12-hex sender pseudonyms
+PrimaryKeyUUID = Uuid(as_uuid=False)
+
+# SQL list of channel values, for CHECK constraints on channel columns
+CHANNEL_VALUES_SQL = ", ".join(f"'{channel.value}'" for channel in FeedbackChannel)
+
+
+class ChannelType(TypeDecorator):
+    """
+    FeedbackChannel stored as its plain string value in a VARCHAR column.
+
+    A CHECK constraint on the column restricts the allowed values instead of
+    a native PostgreSQL ENUM, so adding a channel is an ordinary transactional
+    constraint change rather than ``ALTER TYPE ... ADD VALUE``.
+    """
+
+    impl = String(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return FeedbackChannel(value).value
+
+    def process_result_value(self, value: Optional[str], dialect) -> Optional[FeedbackChannel]:
+        if value is None:
+            return None
+        return FeedbackChannel(value)
+
+
+class HashDigest(TypeDecorator):
+    """
+    SHA-256 hex digest stored as raw 32 bytes (BYTEA) on PostgreSQL.
+
+    Application code always reads and writes the 64-character hex string;
+    other dialects store that string unchanged.
+    """
+
+    impl = String(64)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(BYTEA())
+        return dialect.type_descriptor(String(64))
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Any:
+        if value is not None and dialect.name == "postgresql":
+            return bytes.fromhex(value)
+        return value
+
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        if value is not None and dialect.name == "postgresql":
+            return bytes(value).hex()
+        return value
+
+
+# Axis ratings that nudge overall satisfaction up or down by 0.1
+POSITIVE_AXIS_RATINGS = frozenset({"perfect", "good", "excellent"})
+NEGATIVE_AXIS_RATINGS = frozenset({
+    "poor", "bad", "terrible", "overcooked", "undercooked", "too_salty", "bland"
+})
+
+# Feedback a processing worker may still pick up (or retry)
+ACTIVE_WORK_PREDICATE = "status IN ('pending', 'processing') AND retry_count < 5"
+
+# Columns carried in the leaf pages of the feedback listing indexes
+FEEDBACK_COVER_COLUMNS = ["rating_10", "channel", "status", "is_verified"]
+
+# Serialized timestamps that from_dict turns back into datetimes
+_TIMESTAMP_FIELDS = ("feedback_timestamp", "created_at", "updated_at")
+
+
+def _parse(data: Dict[str, Any], key: str) -> None:
+    """Replace an ISO 8601 string at ``data[key]`` with a datetime, in place."""
+    value = data.get(key)
+    if isinstance(value, str):
+        data[key] = datetime.fromisoformat(value)
+
+
 class FeedbackStatus(str, Enum):
     """Status of feedback processing."""
     PENDING = "pending"
@@ -52,6 +138,9 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    # Read trigger-stamped updated_at back in the flush (RETURNING where
+    # supported), so it never lazy-loads on an AsyncSession
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary identification
     id: Mapped[str] = mapped_column(
@@ -68,12 +157,12 @@ class User(Base):
         comment="Slack user ID"
     )
     phone_hash: Mapped[Optional[str]] = mapped_column(
-        String(64),
+        HashDigest,
         unique=True,
         comment="Hashed phone number for privacy"
     )
     email_hash: Mapped[Optional[str]] = mapped_column(
-        String(64),
+        HashDigest,
         unique=True,
         comment="Hashed email for privacy"
     )
@@ -104,10 +193,12 @@ class User(Base):
         server_default=func.now(),
         nullable=False
     )
+    # Stamped on UPDATE by a database trigger, see add_updated_at_trigger();
+    # FetchedValue tells the ORM to read the new value back after a flush
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
     last_feedback_at: Mapped[Optional[datetime]] = mapped_column(
@@ -117,7 +208,7 @@ class User(Base):
 
     # Preferences
     preferred_channel: Mapped[Optional[FeedbackChannel]] = mapped_column(
-        SQLEnum(FeedbackChannel),
+        ChannelType,
         comment="User's preferred feedback channel"
     )
     notification_enabled: Mapped[bool] = mapped_column(
@@ -126,7 +217,8 @@ class User(Base):
         comment="Whether to send feedback reminders"
     )
 
-    # User statistics
+    # User statistics, maintained by triggers on feedback (see
+    # add_user_stats_triggers()) so reads are plain column lookups
     feedback_count: Mapped[int] = mapped_column(
         Integer,
         default=0,
@@ -137,31 +229,83 @@ class User(Base):
         comment="Average rating given by user"
     )
 
-    # Relationships
+    # Relationships; queries that need them eager-load them explicitly
+    # (selectinload/joinedload). The FK cascades on delete, so the database
+    # removes children without the ORM loading them first.
     feedback_entries: Mapped[List["Feedback"]] = relationship(
         "Feedback",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # Indexes
     __table_args__ = (
+        CheckConstraint(
+            f"preferred_channel IS NULL OR preferred_channel IN ({CHANNEL_VALUES_SQL})",
+            name="valid_preferred_channel"
+        ),
         Index("idx_users_slack_id", "slack_user_id"),
         Index("idx_users_phone_hash", "phone_hash"),
         Index("idx_users_email_hash", "email_hash"),
         Index("idx_users_telegram_id", "telegram_user_id"),
-        Index("idx_users_active", "is_active"),
+        Index(
+            "idx_users_active", "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
         Index("idx_users_last_feedback", "last_feedback_at"),
     )
 
     def __repr__(self) -> str:
         return f"<User(id='{self.id}', display_name='{self.display_name}')>"
 
-    def update_stats(self) -> None:
-        """Update user statistics based on feedback entries."""
-        # This would be called after feedback is added
-        # In practice, this might be computed via database triggers or background jobs
-        pass
+    @classmethod
+    async def feedback_json(cls, session: AsyncSession, user_id: str) -> Optional[str]:
+        """
+        Fetch a user and all their feedback as one JSON document (PostgreSQL).
+
+        PostgreSQL assembles the nested object with ``json_build_object`` and
+        ``json_agg``, newest feedback first, and it comes back as text ready
+        to forward, with no ORM rows hydrated or re-serialized.
+
+        Args:
+            session: Database session (PostgreSQL)
+            user_id: User ID
+
+        Returns:
+            JSON text, or None if the user does not exist
+        """
+        feedback_doc = func.json_build_object(
+            "id", Feedback.id,
+            "entry_id", Feedback.entry_id,
+            "channel", Feedback.channel,
+            "status", Feedback.status,
+            "feedback_timestamp", Feedback.feedback_timestamp,
+            "rating_10", Feedback.rating_10,
+            "axes", Feedback.axes,
+            "metrics", Feedback.metrics,
+            "notes", Feedback.notes,
+        )
+        feedback_list = (
+            select(func.json_agg(aggregate_order_by(
+                feedback_doc, Feedback.feedback_timestamp.desc()
+            )))
+            .where(Feedback.user_id == cls.id)
+            .scalar_subquery()
+        )
+        stmt = select(cast(func.json_build_object(
+            "id", cls.id,
+            "display_name", cls.display_name,
+            "feedback_count", cls.feedback_count,
+            "avg_rating", cls.avg_rating,
+            "last_feedback_at", cls.last_feedback_at,
+            "feedback", func.coalesce(feedback_list, cast(literal("[]"), PG_JSON)),
+        ), Text)).where(cls.id == user_id)
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+
+add_updated_at_trigger(User.__table__)
 
 
 class Feedback(Base):
@@ -173,10 +317,13 @@ class Feedback(Base):
     """
 
     __tablename__ = "feedback"
+    # Read trigger-stamped updated_at back in the flush (RETURNING where
+    # supported), so it never lazy-loads on an AsyncSession
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary identification
     id: Mapped[str] = mapped_column(
-        String(36),
+        PrimaryKeyUUID,
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique feedback ID"
@@ -184,7 +331,7 @@ class Feedback(Base):
 
     # Foreign key relationships
     entry_id: Mapped[str] = mapped_column(
-        String(100),
+        String(61),
         ForeignKey("notebook_entries.id", ondelete="CASCADE"),
         nullable=False,
         comment="Reference to notebook entry"
@@ -198,12 +345,13 @@ class Feedback(Base):
 
     # Feedback metadata
     channel: Mapped[FeedbackChannel] = mapped_column(
-        SQLEnum(FeedbackChannel),
+        ChannelType,
         nullable=False,
         comment="Channel through which feedback was collected"
     )
     status: Mapped[FeedbackStatus] = mapped_column(
-        SQLEnum(FeedbackStatus),
+        # Store the lower-case values, as the migration's feedbackstatus type does
+        SQLEnum(FeedbackStatus, values_callable=lambda enum: [member.value for member in enum]),
         default=FeedbackStatus.PENDING,
         comment="Processing status of feedback"
     )
@@ -214,10 +362,12 @@ class Feedback(Base):
         server_default=func.now(),
         nullable=False
     )
+    # Stamped on UPDATE by a database trigger, see add_updated_at_trigger();
+    # FetchedValue tells the ORM to read the new value back after a flush
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
     feedback_timestamp: Mapped[datetime] = mapped_column(
@@ -234,14 +384,14 @@ class Feedback(Base):
 
     # Structured rating axes
     axes: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Multi-dimensional rating axes (doneness, salt, smoke, crust, etc.)"
     )
 
     # Cooking metrics
     metrics: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Quantitative cooking metrics (internal temp, rest time, etc.)"
     )
@@ -258,14 +408,14 @@ class Feedback(Base):
         comment="Original raw input before normalization"
     )
     normalized_data: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Normalized feedback data after AI processing"
     )
 
     # AI analysis
     ai_insights: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="AI-generated insights and analysis"
     )
@@ -327,49 +477,63 @@ class Feedback(Base):
             "confidence_score IS NULL OR (confidence_score >= 0 AND confidence_score <= 1)",
             name="valid_confidence_range"
         ),
+        # Ensure a known collection channel
+        CheckConstraint(
+            f"channel IN ({CHANNEL_VALUES_SQL})",
+            name="valid_channel"
+        ),
         # Ensure non-negative retry count
         CheckConstraint(
             "retry_count >= 0",
             name="non_negative_retry_count"
         ),
         # Performance indexes
-        Index("idx_feedback_entry_id", "entry_id"),
-        Index("idx_feedback_user_id", "user_id"),
-        Index("idx_feedback_channel", "channel"),
-        Index("idx_feedback_status", "status"),
         Index("idx_feedback_created_at", "created_at"),
         Index("idx_feedback_timestamp", "feedback_timestamp"),
         Index("idx_feedback_rating", "rating_10"),
-        Index("idx_feedback_verified", "is_verified"),
-        # Composite indexes for common queries
-        Index("idx_feedback_entry_timestamp", "entry_id", "feedback_timestamp"),
-        Index("idx_feedback_user_created", "user_id", "created_at"),
+        Index(
+            "idx_feedback_verified", "id",
+            postgresql_where=text("NOT is_verified"),
+            sqlite_where=text("NOT is_verified"),
+        ),
+        # Composite indexes for common queries, covering the list columns so
+        # PostgreSQL can answer per-entry/per-user listings index-only
+        Index(
+            "idx_feedback_entry_cover", "entry_id", "feedback_timestamp",
+            postgresql_include=FEEDBACK_COVER_COLUMNS,
+        ),
+        Index(
+            "idx_feedback_user_cover", "user_id", "created_at",
+            postgresql_include=FEEDBACK_COVER_COLUMNS,
+        ),
         Index("idx_feedback_status_channel", "status", "channel"),
+        # Retry worker queue: only rows still awaiting processing
+        Index(
+            "idx_feedback_active_work", "feedback_timestamp",
+            postgresql_where=text(ACTIVE_WORK_PREDICATE),
+            sqlite_where=text(ACTIVE_WORK_PREDICATE),
+        ),
+        Index(
+            "idx_feedback_axes", "axes",
+            postgresql_using="gin",
+            postgresql_ops={"axes": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
         return f"<Feedback(id='{self.id}', entry_id='{self.entry_id}', rating={self.rating_10})>"
 
-    def to_dict(self, include_raw: bool = False, include_ai: bool = False) -> Dict[str, Any]:
-        """
-        Convert feedback to dictionary representation.
-
-        Args:
-            include_raw: Whether to include raw input data
-            include_ai: Whether to include AI analysis data
-
-        Returns:
-            Dictionary representation of feedback
-        """
+    def _fields(self, include_raw: bool, include_ai: bool) -> Dict[str, Any]:
+        """Collect the serialized fields with their native Python values."""
         result = {
             "id": self.id,
             "entry_id": self.entry_id,
             "user_id": self.user_id,
-            "channel": self.channel.value if self.channel else None,
-            "status": self.status.value if self.status else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "feedback_timestamp": self.feedback_timestamp.isoformat() if self.feedback_timestamp else None,
+            "channel": self.channel,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "feedback_timestamp": self.feedback_timestamp,
             "rating_10": self.rating_10,
             "axes": self.axes,
             "metrics": self.metrics,
@@ -391,24 +555,62 @@ class Feedback(Base):
 
         return result
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Feedback":
+    def to_dict(self, include_raw: bool = False, include_ai: bool = False) -> Dict[str, Any]:
         """
-        Create a Feedback instance from dictionary data.
+        Convert feedback to dictionary representation.
 
         Args:
-            data: Dictionary containing feedback data
+            include_raw: Whether to include raw input data
+            include_ai: Whether to include AI analysis data
 
         Returns:
-            New Feedback instance
+            Dictionary representation of feedback
+        """
+        result = self._fields(include_raw, include_ai)
+
+        # Serialized enum/timestamp strings are memoized per instance, keyed
+        # on the identity of the attribute value, so repeated to_dict() calls
+        # (exports, MCP resources) don't redo .value/isoformat() while a
+        # changed attribute still gets re-serialized
+        memo = self.__dict__.get("_serialized_memo")
+        if memo is None:
+            memo = self._serialized_memo = {}
+        for key in ("channel", "status", "created_at", "updated_at", "feedback_timestamp"):
+            value = result[key]
+            if value is None:
+                continue
+            cached = memo.get(key)
+            if cached is not None and cached[0] is value:
+                result[key] = cached[1]
+            else:
+                serialized = value.value if isinstance(value, Enum) else value.isoformat()
+                memo[key] = (value, serialized)
+                result[key] = serialized
+        return result
+
+    def to_json(self, include_raw: bool = False, include_ai: bool = False) -> bytes:
         """
+        Serialize feedback to JSON bytes with the same content as ``to_dict``.
+
+        Enums and timestamps are handed to orjson unconverted and encoded in
+        one C-level pass, so exports and responses that only write the result
+        out skip the per-field ``.value``/``isoformat()`` calls.
+
+        Args:
+            include_raw: Whether to include raw input data
+            include_ai: Whether to include AI analysis data
+
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        return orjson.dumps(self._fields(include_raw, include_ai))
+
+    @staticmethod
+    def _parse_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse ISO timestamps and enum values in ``data`` in place."""
         # Handle datetime parsing
-        if "feedback_timestamp" in data and isinstance(data["feedback_timestamp"], str):
-            data["feedback_timestamp"] = datetime.fromisoformat(data["feedback_timestamp"])
-        if "created_at" in data and isinstance(data["created_at"], str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if "updated_at" in data and isinstance(data["updated_at"], str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        for key in _TIMESTAMP_FIELDS:
+            _parse(data, key)
 
         # Handle enum parsing
         if "channel" in data and isinstance(data["channel"], str):
@@ -416,49 +618,159 @@ class Feedback(Base):
         if "status" in data and isinstance(data["status"], str):
             data["status"] = FeedbackStatus(data["status"])
 
-        return cls(**data)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Feedback":
+        """
+        Create a Feedback instance from dictionary data.
+
+        Args:
+            data: Dictionary containing feedback data
+
+        Returns:
+            New Feedback instance
+        """
+        return cls(**cls._parse_fields(data))
+
+    @classmethod
+    async def iter_for_entry(
+        cls,
+        session: AsyncSession,
+        entry_id: str,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence["Feedback"]]:
+        """
+        Stream an entry's feedback in batches through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat however
+        much feedback an entry has. Relationships are not loaded. On asyncpg
+        the cursor needs a transaction: use ``get_session()``, not the
+        autocommit ``read_session()``.
+
+        Args:
+            session: Session with an open transaction
+            entry_id: Notebook entry ID
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Lists of up to ``batch_size`` Feedback objects, oldest first
+        """
+        stmt = (
+            select(cls)
+            .where(cls.entry_id == entry_id)
+            .order_by(cls.feedback_timestamp)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await session.stream_scalars(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert many feedback rows with one executemany INSERT.
+
+        Rows take the same shape as ``from_dict`` but no Feedback objects are
+        built or tracked by the session. For very large PostgreSQL loads use
+        ``app.models.bulk_copy``, which streams rows with COPY.
+
+        Args:
+            session: Session whose transaction the rows are inserted in
+            rows: Column-name dictionaries, one per feedback entry
+        """
+        if rows:
+            await session.execute(
+                insert(cls), [cls._parse_fields(dict(row)) for row in rows]
+            )
+
+    # updated_at is stamped by the database trigger on every UPDATE
 
     def mark_completed(self) -> None:
         """Mark feedback as successfully processed."""
         self.status = FeedbackStatus.COMPLETED
-        self.updated_at = datetime.now()
 
     def mark_error(self, error_message: str) -> None:
         """Mark feedback as failed with error message."""
         self.status = FeedbackStatus.ERROR
         self.error_message = error_message
         self.retry_count += 1
-        self.updated_at = datetime.now()
+
+    @classmethod
+    async def mark_completed_by_ids(cls, session: AsyncSession, feedback_ids: Sequence[str]) -> int:
+        """
+        Mark feedback as processed with one UPDATE, without loading the rows.
+
+        Args:
+            session: Database session
+            feedback_ids: IDs of the feedback to mark
+
+        Returns:
+            Number of rows updated
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(feedback_ids))
+            .values(status=FeedbackStatus.COMPLETED)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @classmethod
+    async def mark_error_by_ids(
+        cls,
+        session: AsyncSession,
+        feedback_ids: Sequence[str],
+        error_message: str,
+    ) -> int:
+        """
+        Mark feedback as failed with one UPDATE, incrementing retry_count in SQL.
+
+        Args:
+            session: Database session
+            feedback_ids: IDs of the feedback to mark
+            error_message: Error message to record
+
+        Returns:
+            Number of rows updated
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(feedback_ids))
+            .values(
+                status=FeedbackStatus.ERROR,
+                error_message=error_message,
+                retry_count=cls.retry_count + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    # The JSON setters assign a new dict rather than mutating in place: plain
+    # JSON columns don't track nested changes, so an in-place update would be
+    # silently dropped at flush.
 
     def add_ai_insight(self, insight_type: str, data: Any) -> None:
         """Add AI-generated insight to the feedback."""
-        if not self.ai_insights:
-            self.ai_insights = {}
-        self.ai_insights[insight_type] = data
+        self.ai_insights = {**(self.ai_insights or {}), insight_type: data}
 
     def get_axis_rating(self, axis: str) -> Optional[str]:
         """Get rating for a specific axis (e.g., 'doneness', 'salt')."""
-        if self.axes and axis in self.axes:
-            return self.axes[axis]
-        return None
+        axes = self.axes
+        return axes.get(axis) if axes else None
 
     def set_axis_rating(self, axis: str, rating: str) -> None:
         """Set rating for a specific axis."""
-        if not self.axes:
-            self.axes = {}
-        self.axes[axis] = rating
+        self.axes = {**(self.axes or {}), axis: rating}
 
     def get_metric(self, metric: str) -> Optional[float]:
         """Get a specific cooking metric (e.g., 'internal_temp_c', 'rest_minutes')."""
-        if self.metrics and metric in self.metrics:
-            return self.metrics[metric]
-        return None
+        metrics = self.metrics
+        return metrics.get(metric) if metrics else None
 
     def set_metric(self, metric: str, value: float) -> None:
         """Set a specific cooking metric."""
-        if not self.metrics:
-            self.metrics = {}
-        self.metrics[metric] = value
+        self.metrics = {**(self.metrics or {}), metric: value}
 
     def calculate_overall_satisfaction(self) -> Optional[float]:
         """
@@ -474,21 +786,122 @@ class Feedback(Base):
 
         # Adjust based on axis ratings if available
         if self.axes:
-            positive_axes = ["perfect", "good", "excellent"]
-            negative_axes = ["poor", "bad", "terrible", "overcooked", "undercooked", "too_salty", "bland"]
-
             adjustment = 0
-            axis_count = 0
 
-            for axis, rating in self.axes.items():
-                if rating.lower() in positive_axes:
+            # Non-string ratings (e.g. numeric axes) count as neutral
+            for rating in self.axes.values():
+                if not isinstance(rating, str):
+                    continue
+                rating = rating.lower()
+                if rating in POSITIVE_AXIS_RATINGS:
                     adjustment += 0.1
-                elif rating.lower() in negative_axes:
+                elif rating in NEGATIVE_AXIS_RATINGS:
                     adjustment -= 0.1
-                axis_count += 1
 
-            if axis_count > 0:
-                adjustment = adjustment / axis_count  # Average adjustment
-                base_score = max(0, min(1, base_score + adjustment))
+            adjustment = adjustment / len(self.axes)  # Average adjustment
+            base_score = max(0, min(1, base_score + adjustment))
 
-        return base_score
\ No newline at end of file
+        return base_score
+
+    @hybrid_property
+    def overall_satisfaction(self) -> Optional[float]:
+        """
+        Overall satisfaction score, as computed by ``calculate_overall_satisfaction``.
+
+        At class level this is a PostgreSQL expression (over
+        ``jsonb_each_text(axes)``), so analytics can select or aggregate the
+        score for many rows in one query without loading them:
+        ``select(func.avg(Feedback.overall_satisfaction))``.
+        """
+        return self.calculate_overall_satisfaction()
+
+    @overall_satisfaction.expression
+    def overall_satisfaction(cls):
+        axis = func.jsonb_each_text(cls.axes).table_valued("key", "value").alias("axis")
+        rating = func.lower(axis.c.value)
+        # Mean of the per-axis nudges; NULL when there are no axes
+        adjustment = (
+            select(func.avg(case(
+                (rating.in_(sorted(POSITIVE_AXIS_RATINGS)), 0.1),
+                (rating.in_(sorted(NEGATIVE_AXIS_RATINGS)), -0.1),
+                else_=0.0,
+            )))
+            .select_from(axis)
+            .scalar_subquery()
+        )
+        base_score = cls.rating_10 / 10.0
+        return case(
+            (cls.rating_10.is_(None), None),
+            (adjustment.is_(None), base_score),
+            else_=func.greatest(0.0, func.least(1.0, base_score + adjustment)),
+        )
+
+
+add_updated_at_trigger(Feedback.__table__)
+
+
+def add_user_stats_triggers(table: Table) -> None:
+    """
+    Maintain ``users.feedback_count`` and ``users.avg_rating`` from ``table``.
+
+    Inserts and deletes adjust the count in place; the average is re-read
+    through idx_feedback_user_cover, which carries rating_10, so it is an
+    index-only scan over one user's rows. Mirrors the triggers created by the
+    initial Alembic migration.
+
+    Args:
+        table: The feedback table
+    """
+    name = table.name
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            "CREATE OR REPLACE FUNCTION update_user_feedback_stats() RETURNS trigger AS $$ "
+            "BEGIN "
+            "IF TG_OP = 'INSERT' THEN "
+            f"UPDATE users SET feedback_count = feedback_count + 1, "
+            f"avg_rating = (SELECT avg(rating_10) FROM {name} WHERE user_id = NEW.user_id) "
+            "WHERE id = NEW.user_id; "
+            "ELSIF TG_OP = 'DELETE' THEN "
+            f"UPDATE users SET feedback_count = feedback_count - 1, "
+            f"avg_rating = (SELECT avg(rating_10) FROM {name} WHERE user_id = OLD.user_id) "
+            "WHERE id = OLD.user_id; "
+            "ELSE "
+            f"UPDATE users SET feedback_count = (SELECT count(*) FROM {name} f WHERE f.user_id = users.id), "
+            f"avg_rating = (SELECT avg(f.rating_10) FROM {name} f WHERE f.user_id = users.id) "
+            "WHERE id IN (OLD.user_id, NEW.user_id); "
+            "END IF; "
+            "RETURN NULL; "
+            "END; "
+            "$$ LANGUAGE plpgsql;"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{name}_user_stats "
+            f"AFTER INSERT OR DELETE OR UPDATE OF user_id, rating_10 ON {name} "
+            f"FOR EACH ROW EXECUTE FUNCTION update_user_feedback_stats();"
+        ).execute_if(dialect="postgresql"),
+    )
+    for trigger in (
+        f"CREATE TRIGGER trg_{name}_user_stats_insert AFTER INSERT ON {name} "
+        f"FOR EACH ROW BEGIN UPDATE users SET feedback_count = feedback_count + 1, "
+        f"avg_rating = (SELECT avg(rating_10) FROM {name} WHERE user_id = NEW.user_id) "
+        f"WHERE id = NEW.user_id; END;",
+        f"CREATE TRIGGER trg_{name}_user_stats_delete AFTER DELETE ON {name} "
+        f"FOR EACH ROW BEGIN UPDATE users SET feedback_count = feedback_count - 1, "
+        f"avg_rating = (SELECT avg(rating_10) FROM {name} WHERE user_id = OLD.user_id) "
+        f"WHERE id = OLD.user_id; END;",
+        f"CREATE TRIGGER trg_{name}_user_stats_update AFTER UPDATE OF user_id, rating_10 ON {name} "
+        f"FOR EACH ROW BEGIN UPDATE users SET "
+        f"feedback_count = (SELECT count(*) FROM {name} f WHERE f.user_id = users.id), "
+        f"avg_rating = (SELECT avg(f.rating_10) FROM {name} f WHERE f.user_id = users.id) "
+        f"WHERE id IN (OLD.user_id, NEW.user_id); END;",
+    ):
+        event.listen(table, "after_create", DDL(trigger).execute_if(dialect="sqlite"))
+
+
+add_user_stats_triggers(Feedback.__table__)
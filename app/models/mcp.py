@@ -6,37 +6,56 @@ including request/response models for resources and tools, error handling,
 and validation schemas for the Cooking Lab Notebook MCP server.
 """
 
+import calendar
+import re
+import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, Literal
+from typing import Annotated, Any, Dict, Final, List, Optional, Union, Literal
 from enum import Enum
 
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # Base MCP Protocol Models
 
+class TrustedModel(BaseModel):
+    """Base for envelopes that are also built from already-validated data."""
+
+    @classmethod
+    def construct_trusted(cls, **data: Any):
+        """
+        Build an instance without running validators.
+
+        Only for data the server produced itself (response building, cache
+        rehydration); external JSON-RPC input goes through normal validation.
+        """
+        return cls.model_construct(**data)
+
+
 class MCPError(BaseModel):
     """MCP protocol error model."""
 
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
-    data: Optional[Dict[str, Any]] = Field(None, description="Additional error data")
+    model_config = ConfigDict(frozen=True)
+
+    code: str
+    message: str
+    data: Optional[Dict[str, Any]] = None
 
 
-class MCPRequest(BaseModel):
+class MCPRequest(TrustedModel):
     """Base MCP request model."""
 
-    id: Union[str, int] = Field(..., description="Request ID")
-    method: str = Field(..., description="Method name")
-    params: Optional[Dict[str, Any]] = Field(None, description="Method parameters")
+    id: Union[str, int]
+    method: str
+    params: Optional[Dict[str, Any]] = None
 
 
 class MCPResponse(BaseModel):
     """Base MCP response model."""
 
-    id: Union[str, int] = Field(..., description="Request ID")
-    result: Optional[Dict[str, Any]] = Field(None, description="Result data")
-    error: Optional[MCPError] = Field(None, description="Error information")
+    id: Union[str, int]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[MCPError] = None
 
 
 # Resource Models
@@ -51,19 +70,19 @@ class ResourceType(str, Enum):
 class MCPResource(BaseModel):
     """MCP resource descriptor."""
 
-    uri: str = Field(..., description="Resource URI")
-    name: str = Field(..., description="Human-readable name")
-    description: Optional[str] = Field(None, description="Resource description")
-    mimeType: Optional[str] = Field(None, description="MIME type")
+    uri: str
+    name: str
+    description: Optional[str] = None
+    mimeType: Optional[str] = None
 
 
 class MCPResourceContent(BaseModel):
     """MCP resource content."""
 
-    uri: str = Field(..., description="Resource URI")
-    mimeType: str = Field(..., description="MIME type")
-    text: Optional[str] = Field(None, description="Text content")
-    blob: Optional[str] = Field(None, description="Base64-encoded blob content")
+    uri: str
+    mimeType: str
+    text: Optional[str] = None
+    blob: Optional[str] = None
 
 
 class ListResourcesRequest(BaseModel):
@@ -73,20 +92,23 @@ class ListResourcesRequest(BaseModel):
     params: Optional[Dict[str, Any]] = None
 
 
-class ListResourcesResponse(BaseModel):
+class ListResourcesResponse(TrustedModel):
     """Response with list of available resources."""
 
+    model_config = ConfigDict(frozen=True)
+
     resources: List[MCPResource] = Field(..., description="Available resources")
     nextCursor: Optional[str] = Field(None, description="Pagination cursor")
 
 
-class ReadResourceRequest(BaseModel):
+class ReadResourceRequest(TrustedModel):
     """Request to read a specific resource."""
 
     method: Literal["resources/read"] = "resources/read"
     params: Dict[str, str] = Field(..., description="Parameters with URI")
 
-    @validator('params')
+    @field_validator('params')
+    @classmethod
     def validate_uri_param(cls, v):
         if 'uri' not in v:
             raise ValueError("URI parameter is required")
@@ -99,6 +121,43 @@ class ReadResourceResponse(BaseModel):
     contents: List[MCPResourceContent] = Field(..., description="Resource contents")
 
 
+# Tool Result Content Types
+
+class TextContent(BaseModel):
+    """Text content for tool results."""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["text"] = "text"
+    text: str = Field(..., description="Text content")
+
+
+class JsonContent(BaseModel):
+    """JSON content for tool results."""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["json"] = "json"
+    json: Dict[str, Any] = Field(..., description="JSON content")
+
+
+class ErrorContent(BaseModel):
+    """Error content for tool results."""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["error"] = "error"
+    error: str = Field(..., description="Error message")
+    code: Optional[str] = Field(None, description="Error code")
+
+
+# Tool output items, dispatched on their ``type`` tag
+ContentItem = Annotated[
+    Union[TextContent, JsonContent, ErrorContent],
+    Field(discriminator="type")
+]
+
+
 # Tool Models
 
 class MCPTool(BaseModel):
@@ -122,13 +181,14 @@ class ListToolsResponse(BaseModel):
     tools: List[MCPTool] = Field(..., description="Available tools")
 
 
-class CallToolRequest(BaseModel):
+class CallToolRequest(TrustedModel):
     """Request to call a tool."""
 
     method: Literal["tools/call"] = "tools/call"
     params: Dict[str, Any] = Field(..., description="Tool parameters")
 
-    @validator('params')
+    @field_validator('params')
+    @classmethod
     def validate_tool_params(cls, v):
         if 'name' not in v:
             raise ValueError("Tool name is required")
@@ -138,14 +198,14 @@ class CallToolRequest(BaseModel):
 class ToolResult(BaseModel):
     """Result from tool execution."""
 
-    content: List[Dict[str, Any]] = Field(..., description="Tool output content")
+    content: List[ContentItem] = Field(..., description="Tool output content")
     isError: bool = Field(False, description="Whether the result is an error")
 
 
 class CallToolResponse(BaseModel):
     """Response from tool call."""
 
-    content: List[Dict[str, Any]] = Field(..., description="Tool output")
+    content: List[ContentItem] = Field(..., description="Tool output")
     isError: bool = Field(False, description="Whether the result is an error")
 
 
@@ -185,6 +245,8 @@ class AttachmentResource(BaseModel):
 class SearchResult(BaseModel):
     """Search result item."""
 
+    model_config = ConfigDict(frozen=True)
+
     entry_id: str = Field(..., description="Entry ID")
     title: str = Field(..., description="Entry title")
     relevance_score: float = Field(..., description="Search relevance score")
@@ -306,48 +368,34 @@ class SynthesizeICSInput(BaseModel):
     )
 
 
-# Tool Result Content Types
-
-class TextContent(BaseModel):
-    """Text content for tool results."""
-
-    type: Literal["text"] = "text"
-    text: str = Field(..., description="Text content")
-
-
-class JsonContent(BaseModel):
-    """JSON content for tool results."""
-
-    type: Literal["json"] = "json"
-    json: Dict[str, Any] = Field(..., description="JSON content")
-
-
-class ErrorContent(BaseModel):
-    """Error content for tool results."""
-
-    type: Literal["error"] = "error"
-    error: str = Field(..., description="Error message")
-    code: Optional[str] = Field(None, description="Error code")
+# Validation Helpers
+#
+# These stay plain Python: their cost is the compiled regex match and a
+# few integer comparisons, both already running in C, so compiling the
+# module (Cython/mypyc) would only shave the call overhead.
 
+_ENTRY_ID_RE = re.compile(r"^([0-9]{4})-([0-9]{2})-([0-9]{2})_[a-z0-9-]{1,50}$")
+_UNSAFE_URI_RE = re.compile(r'[<>:"|?*\x00-\x1f]')
 
-# Validation Helpers
 
-def validate_entry_id(entry_id: str) -> bool:
-    """Validate entry ID format."""
-    import re
-    from datetime import datetime
+def validate_entry_id(entry_id: str) -> Optional[str]:
+    """
+    Validate entry ID format.
 
-    pattern = r"^[0-9]{4}-[0-9]{2}-[0-9]{2}_[a-z0-9-]{1,50}$"
-    if not re.match(pattern, entry_id):
-        return False
+    Returns the interned ID when valid (so repeated IDs share one string and
+    compare by identity in dict lookups), otherwise None.
+    """
+    match = _ENTRY_ID_RE.match(entry_id)
+    if not match:
+        return None
 
     # Validate the date portion
-    try:
-        date_part = entry_id.split('_')[0]
-        datetime.strptime(date_part, '%Y-%m-%d')
-        return True
-    except (ValueError, IndexError):
-        return False
+    year, month, day = map(int, match.groups())
+    if year < 1 or not 1 <= month <= 12:
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return sys.intern(entry_id)
 
 
 def validate_uri_path(uri: str) -> bool:
@@ -360,8 +408,7 @@ def validate_uri_path(uri: str) -> bool:
         return False
 
     # Check for invalid characters
-    import re
-    if re.search(r'[<>:"|?*\x00-\x1f]', uri):
+    if _UNSAFE_URI_RE.search(uri):
         return False
 
     return True
@@ -378,12 +425,24 @@ class ErrorCode(str, Enum):
     E_RATE = "E_RATE"
 
 
+# Plain-string codes for hot paths; avoids the Enum member and .value
+# descriptor lookups. ErrorCode stays the public, typed vocabulary.
+E_NOT_FOUND: Final[str] = ErrorCode.E_NOT_FOUND.value
+E_SCHEMA: Final[str] = ErrorCode.E_SCHEMA.value
+E_IO: Final[str] = ErrorCode.E_IO.value
+E_GIT: Final[str] = ErrorCode.E_GIT.value
+E_SECURITY: Final[str] = ErrorCode.E_SECURITY.value
+E_RATE: Final[str] = ErrorCode.E_RATE.value
+
+
 # Utility Functions
 
-def create_error_response(code: ErrorCode, message: str, details: Optional[Dict[str, Any]] = None) -> MCPError:
-    """Create a standardized MCP error response."""
+def create_error_response(
+    code: Union[ErrorCode, str], message: str, details: Optional[Dict[str, Any]] = None
+) -> MCPError:
+    """Create a standardized MCP error response from an ErrorCode or raw code string."""
     return MCPError(
-        code=code.value,
+        code=code.value if isinstance(code, ErrorCode) else code,
         message=message,
         data=details
     )
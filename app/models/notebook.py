@@ -6,21 +6,156 @@ enhanced schema specification in CLAUDE.md, supporting AI metadata, semantic sea
 and comprehensive cooking data tracking.
 """
 
+import base64
+import heapq
+import sys
+from array import array
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence
 from decimal import Decimal
 
 from sqlalchemy import (
     Boolean, DateTime, Float, Integer, String, Text, JSON,
-    Index, UniqueConstraint, CheckConstraint, ForeignKey
+    Index, UniqueConstraint, CheckConstraint, ForeignKey, DDL, Table, event,
+    Computed, BigInteger, FetchedValue, MetaData, select
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship, validates
 from sqlalchemy.sql import func
+import orjson
 import uuid
 
-Base = declarative_base()
+# Deterministic constraint names, shared with Alembic through target_metadata
+NAMING_CONVENTION = {
+    "ix": "idx_%(table_name)s_%(column_0_N_name)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
+
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Related recipes kept in ai_metadata["similarity_scores"]
+MAX_SIMILARITY_SCORES = 10
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; bulk loads repeat the same dates heavily."""
+    return datetime.fromisoformat(value)
+
+
+def pack_embedding(embedding: Sequence[float]) -> Dict[str, Any]:
+    """
+    Quantize an embedding to int8 and base64-encode it for JSON storage.
+
+    Components are scaled symmetrically by the vector's largest magnitude,
+    so each takes one byte (1.3 base64 characters) instead of ~20 characters
+    of JSON text. Rounding error is at most ``scale / 2`` per component; for
+    a 768-d vector the decoded copy keeps a cosine similarity above 0.9999.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        ``{"dtype": "int8", "scale": <float>, "data": <base64>}``
+    """
+    scale = max((abs(v) for v in embedding), default=0.0) / 127 or 1.0
+    values = array("b", [round(v / scale) for v in embedding])
+    data = base64.b64encode(values.tobytes()).decode("ascii")
+    return {"dtype": "int8", "scale": scale, "data": data}
+
+
+def unpack_embedding(packed: Dict[str, Any]) -> List[float]:
+    """Decode an embedding produced by ``pack_embedding``."""
+    raw = base64.b64decode(packed["data"])
+    if packed.get("dtype") == "int8":
+        scale = packed["scale"]
+        return [v * scale for v in array("b", raw)]
+
+    # Little-endian float32, as written before quantization
+    values = array("f", raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+# Shared PostgreSQL trigger function that stamps updated_at on UPDATE
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at = now(); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql;"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+def add_updated_at_trigger(table: Table) -> None:
+    """
+    Maintain ``table.updated_at`` with a database trigger instead of an ORM onupdate.
+
+    Mirrors the triggers created by the initial Alembic migration so schemas
+    built with ``create_all`` behave the same way.
+
+    Args:
+        table: Table with ``id`` and ``updated_at`` columns
+    """
+    name = table.name
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{name}_updated_at BEFORE UPDATE ON {name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at();"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{name}_updated_at AFTER UPDATE ON {name} "
+            f"FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+            f"BEGIN UPDATE {name} SET updated_at = CURRENT_TIMESTAMP "
+            f"WHERE id = NEW.id; END;"
+        ).execute_if(dialect="sqlite"),
+    )
+
+
+class EntryViewCount(Base):
+    """
+    View counter for a notebook entry, kept in its own narrow table.
+
+    Incrementing a counter on the wide notebook_entries row would rewrite the
+    whole row and touch every one of its indexes; here an increment is a
+    small upsert on a two-column row with a single primary key index.
+    """
+
+    __tablename__ = "entry_view_counts"
+
+    entry_id: Mapped[str] = mapped_column(
+        String(61),
+        ForeignKey("notebook_entries.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to notebook entry"
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        comment="Number of times entry has been viewed"
+    )
+
+    def __repr__(self) -> str:
+        return f"<EntryViewCount(entry_id='{self.entry_id}', count={self.count})>"
 
 
 class NotebookEntry(Base):
@@ -36,10 +171,13 @@ class NotebookEntry(Base):
     """
 
     __tablename__ = "notebook_entries"
+    # Read trigger-stamped updated_at back in the flush (RETURNING where
+    # supported), so it never lazy-loads on an AsyncSession
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary identification and versioning
     id: Mapped[str] = mapped_column(
-        String(100),
+        String(61),
         primary_key=True,
         comment="Format: YYYY-MM-DD_slug"
     )
@@ -55,10 +193,12 @@ class NotebookEntry(Base):
         server_default=func.now(),
         nullable=False
     )
+    # Stamped on UPDATE by a database trigger, see add_updated_at_trigger();
+    # FetchedValue tells the ORM to read the new value back after a flush
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
 
@@ -74,14 +214,20 @@ class NotebookEntry(Base):
         comment="Date of cooking session"
     )
 
+    entry_date_from_id: Mapped[Optional[str]] = mapped_column(
+        String(10),
+        Computed("substr(id, 1, 10)", persisted=True),
+        comment="YYYY-MM-DD prefix of id, stored at write time for date-range scans"
+    )
+
     # Categorization and metadata
     tags: Mapped[List[str]] = mapped_column(
-        JSON,
+        JSONType,
         default=list,
         comment="AI-enhanced categorization tags"
     )
     gear_ids: Mapped[List[str]] = mapped_column(
-        JSON,
+        JSONType,
         default=list,
         comment="References to normalized equipment catalog"
     )
@@ -122,14 +268,14 @@ class NotebookEntry(Base):
 
     # Style guidelines
     style_guidelines: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Cooking style preferences and guidelines"
     )
 
     # Normalized ingredients with AI enhancement
     ingredients_normalized: Mapped[List[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONType,
         default=list,
         comment="Structured ingredient data with AI normalization"
     )
@@ -142,36 +288,38 @@ class NotebookEntry(Base):
 
     # Observations during cooking
     observations: Mapped[List[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONType,
         default=list,
         comment="Time-series observations with AI insights"
     )
 
     # Cooking outcomes and results
     outcomes: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Results, ratings, and AI recommendations"
     )
 
     # Scheduling and timing optimization
     scheduling: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
         comment="Make-ahead scheduling and AI-optimized timing"
     )
 
     # External links and references
     links: Mapped[List[Dict[str, str]]] = mapped_column(
-        JSON,
+        JSONType,
         default=list,
         comment="External recipe links and references"
     )
 
-    # AI metadata for enhanced features
+    # AI metadata for enhanced features. Deferred: it carries the embedding
+    # and is only needed for full-entry reads, which undefer() it explicitly
     ai_metadata: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONType,
         default=dict,
+        deferred=True,
         comment="AI embeddings, similarity scores, and generated content"
     )
 
@@ -181,21 +329,44 @@ class NotebookEntry(Base):
         comment="Git commit SHA for this version"
     )
     git_file_path: Mapped[Optional[str]] = mapped_column(
-        String(500),
+        String(255),
         comment="Relative path in Git repository"
     )
 
     # Performance and analytics
-    view_count: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        comment="Number of times entry has been viewed"
+    # Read-only; increments go through the entry_view_counts side table
+    view_count: Mapped[int] = column_property(
+        func.coalesce(
+            select(EntryViewCount.count)
+            .where(EntryViewCount.entry_id == id)
+            .scalar_subquery(),
+            0
+        )
     )
     success_rate: Mapped[Optional[float]] = mapped_column(
         Float,
         comment="Historical success rate for this recipe"
     )
 
+    # Hot facets of the JSON columns, kept in sync on assignment (see
+    # _sync_outcome_facets/_sync_observation_facets) so rating filters and
+    # listings read typed columns instead of parsing the blobs
+    rating_10: Mapped[Optional[float]] = mapped_column(
+        Float,
+        comment="outcomes['rating_10']"
+    )
+    observation_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Number of entries in observations"
+    )
+    last_observation_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        comment="Timestamp of the latest observation"
+    )
+
     # Relationships
     feedback_entries: Mapped[List["Feedback"]] = relationship(
         "Feedback",
@@ -205,9 +376,10 @@ class NotebookEntry(Base):
 
     # Constraints and validation
     __table_args__ = (
-        # Ensure valid ID format
+        # Ensure valid ID shape (full pattern is validated in the application)
         CheckConstraint(
-            "id ~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}_[a-z0-9-]{1,50}$'",
+            "length(id) BETWEEN 12 AND 61 "
+            "AND substr(id, 5, 1) = '-' AND substr(id, 8, 1) = '-' AND substr(id, 11, 1) = '_'",
             name="valid_entry_id_format"
         ),
         # Ensure difficulty level is in valid range
@@ -234,42 +406,68 @@ class NotebookEntry(Base):
             name="positive_servings"
         ),
         # Performance indexes
-        Index("idx_notebook_entries_date", "date"),
+        Index("idx_notebook_entries_entry_date", "entry_date_from_id"),
         Index("idx_notebook_entries_created_at", "created_at"),
         Index("idx_notebook_entries_updated_at", "updated_at"),
-        Index("idx_notebook_entries_tags", "tags", postgresql_using="gin"),
+        Index(
+            "idx_notebook_entries_tags", "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_notebook_entries_ai_metadata", "ai_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"ai_metadata": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
         Index("idx_notebook_entries_cooking_method", "cooking_method"),
-        Index("idx_notebook_entries_difficulty", "difficulty_level"),
         Index("idx_notebook_entries_git_commit", "git_commit_sha"),
         # Composite indexes for common queries
         Index("idx_notebook_entries_date_method", "date", "cooking_method"),
         Index("idx_notebook_entries_difficulty_servings", "difficulty_level", "servings"),
+        Index("idx_notebook_entries_rating_10", "rating_10"),
     )
 
     def __repr__(self) -> str:
         return f"<NotebookEntry(id='{self.id}', title='{self.title}', date='{self.date}')>"
 
-    def to_dict(self, include_ai_metadata: bool = False) -> Dict[str, Any]:
-        """
-        Convert the entry to a dictionary representation.
-
-        Args:
-            include_ai_metadata: Whether to include AI metadata in the output
-
-        Returns:
-            Dictionary representation of the entry
-        """
+    @validates("outcomes")
+    def _sync_outcome_facets(
+        self, key: str, outcomes: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Mirror ``outcomes['rating_10']`` into the ``rating_10`` column."""
+        rating = outcomes.get("rating_10") if outcomes else None
+        try:
+            self.rating_10 = float(rating) if rating is not None else None
+        except (TypeError, ValueError):
+            self.rating_10 = None
+        return outcomes
+
+    @validates("observations")
+    def _sync_observation_facets(
+        self, key: str, observations: Optional[List[Dict[str, Any]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Mirror the observation count and last ``at`` into typed columns."""
+        self.observation_count = len(observations) if observations else 0
+        last_at = observations[-1].get("at") if observations else None
+        try:
+            self.last_observation_at = datetime.fromisoformat(last_at) if last_at else None
+        except (TypeError, ValueError):
+            self.last_observation_at = None
+        return observations
+
+    def _fields(self, include_ai_metadata: bool) -> Dict[str, Any]:
+        """Collect the serialized fields with their native Python values."""
         result = {
             "id": self.id,
             "version": self.version,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "title": self.title,
-            "date": self.date.isoformat() if self.date else None,
+            "date": self.date,
             "tags": self.tags,
             "gear_ids": self.gear_ids,
             "servings": self.servings,
-            "dinner_time": self.dinner_time.isoformat() if self.dinner_time else None,
+            "dinner_time": self.dinner_time,
             "cooking_method": self.cooking_method,
             "difficulty_level": self.difficulty_level,
             "prep_time_minutes": self.prep_time_minutes,
@@ -293,6 +491,53 @@ class NotebookEntry(Base):
 
         return result
 
+    def to_dict(self, include_ai_metadata: bool = False) -> Dict[str, Any]:
+        """
+        Convert the entry to a dictionary representation.
+
+        Args:
+            include_ai_metadata: Whether to include AI metadata in the output
+
+        Returns:
+            Dictionary representation of the entry
+        """
+        result = self._fields(include_ai_metadata)
+
+        # isoformat() strings are memoized per instance, keyed on the identity
+        # of the datetime they came from. Only the timestamps are cached: the
+        # JSON columns are mutated in place (add_observation) without touching
+        # updated_at, so a whole-dict cache could go stale
+        memo = self.__dict__.get("_serialized_memo")
+        if memo is None:
+            memo = self._serialized_memo = {}
+        for key in ("created_at", "updated_at", "date", "dinner_time"):
+            value = result[key]
+            if value is None:
+                continue
+            cached = memo.get(key)
+            if cached is not None and cached[0] is value:
+                result[key] = cached[1]
+            else:
+                serialized = value.isoformat()
+                memo[key] = (value, serialized)
+                result[key] = serialized
+        return result
+
+    def to_json(self, include_ai_metadata: bool = False) -> bytes:
+        """
+        Serialize the entry to JSON bytes with the same content as ``to_dict``.
+
+        Timestamps are handed to orjson unconverted and encoded along with the
+        JSON columns in one C-level pass.
+
+        Args:
+            include_ai_metadata: Whether to include AI metadata in the output
+
+        Returns:
+            UTF-8 encoded JSON object
+        """
+        return orjson.dumps(self._fields(include_ai_metadata))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "NotebookEntry":
         """
@@ -305,25 +550,19 @@ class NotebookEntry(Base):
             New NotebookEntry instance
         """
         # Handle datetime parsing
-        if "date" in data and isinstance(data["date"], str):
-            data["date"] = datetime.fromisoformat(data["date"])
-        if "dinner_time" in data and isinstance(data["dinner_time"], str):
-            data["dinner_time"] = datetime.fromisoformat(data["dinner_time"])
-        if "created_at" in data and isinstance(data["created_at"], str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if "updated_at" in data and isinstance(data["updated_at"], str):
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        for key in ("date", "dinner_time", "created_at", "updated_at"):
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = _parse_iso(value)
 
         return cls(**data)
 
     def update_total_time(self) -> None:
         """Update the computed total_time_minutes field."""
-        if self.prep_time_minutes and self.cook_time_minutes:
-            self.total_time_minutes = self.prep_time_minutes + self.cook_time_minutes
-        elif self.prep_time_minutes:
-            self.total_time_minutes = self.prep_time_minutes
-        elif self.cook_time_minutes:
-            self.total_time_minutes = self.cook_time_minutes
+        # Left as-is when neither time is known, so a supplied total survives
+        total = (self.prep_time_minutes or 0) + (self.cook_time_minutes or 0)
+        if total:
+            self.total_time_minutes = total
 
     def add_observation(self, observation: Dict[str, Any]) -> None:
         """
@@ -332,25 +571,43 @@ class NotebookEntry(Base):
         Args:
             observation: Observation data with temperature, notes, etc.
         """
-        if not observation.get("at"):
-            observation["at"] = datetime.now().isoformat()
+        self.add_observations([observation])
 
-        if not self.observations:
-            self.observations = []
+    def add_observations(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Add several cooking observations at once.
 
-        self.observations.append(observation)
+        Observations without an ``at`` timestamp share a single timestamp
+        taken once for the batch, and the column is reassigned once.
+
+        Args:
+            batch: Observation dicts, in chronological order
+        """
+        now_iso = None
+        for observation in batch:
+            if not observation.get("at"):
+                if now_iso is None:
+                    now_iso = datetime.now().isoformat()
+                observation["at"] = now_iso
+
+        # Assign a new list so the JSON column is flagged as changed and the
+        # observation facets are refreshed
+        self.observations = [*(self.observations or []), *batch]
 
     def get_ai_embedding(self) -> Optional[List[float]]:
         """Get the AI embedding vector for semantic search."""
-        if self.ai_metadata and "embeddings" in self.ai_metadata:
-            return self.ai_metadata["embeddings"]
-        return None
+        embedding = self.ai_metadata.get("embeddings") if self.ai_metadata else None
+        if isinstance(embedding, dict):
+            return unpack_embedding(embedding)
+        # Entries written before packing stored a plain list of floats
+        return embedding
 
-    def set_ai_embedding(self, embedding: List[float]) -> None:
+    def set_ai_embedding(self, embedding: Sequence[float]) -> None:
         """Set the AI embedding vector for semantic search."""
-        if not self.ai_metadata:
-            self.ai_metadata = {}
-        self.ai_metadata["embeddings"] = embedding
+        metadata = dict(self.ai_metadata or {})
+        metadata["embeddings"] = pack_embedding(embedding)
+        # Assign a new dict so the JSON column is flagged as changed
+        self.ai_metadata = metadata
 
     def get_similarity_scores(self) -> List[Dict[str, Any]]:
         """Get related recipe similarity scores."""
@@ -359,23 +616,28 @@ class NotebookEntry(Base):
         return []
 
     def add_similarity_score(self, recipe_id: str, score: float) -> None:
-        """Add a similarity score for a related recipe."""
-        if not self.ai_metadata:
-            self.ai_metadata = {}
-        if "similarity_scores" not in self.ai_metadata:
-            self.ai_metadata["similarity_scores"] = []
-
-        # Remove existing score for this recipe and add new one
-        self.ai_metadata["similarity_scores"] = [
-            s for s in self.ai_metadata["similarity_scores"]
-            if s.get("recipe_id") != recipe_id
-        ]
-        self.ai_metadata["similarity_scores"].append({
-            "recipe_id": recipe_id,
-            "score": score
-        })
-
-        # Keep only top 10 similarity scores
-        self.ai_metadata["similarity_scores"].sort(
-            key=lambda x: x["score"], reverse=True
-        )[:10]
\ No newline at end of file
+        """Add a similarity score for a related recipe, keeping the top scores."""
+        self.add_similarity_scores({recipe_id: score})
+
+    def add_similarity_scores(self, new_scores: Dict[str, float]) -> None:
+        """
+        Merge a batch of related-recipe scores and trim to the top scores once.
+
+        Args:
+            new_scores: Mapping of recipe ID to similarity score; replaces any
+                existing score for the same recipe
+        """
+        metadata = dict(self.ai_metadata or {})
+
+        scores = {s.get("recipe_id"): s for s in metadata.get("similarity_scores", [])}
+        for recipe_id, score in new_scores.items():
+            scores[recipe_id] = {"recipe_id": recipe_id, "score": score}
+
+        metadata["similarity_scores"] = heapq.nlargest(
+            MAX_SIMILARITY_SCORES, scores.values(), key=itemgetter("score")
+        )
+        # Assign a new dict so the JSON column is flagged as changed
+        self.ai_metadata = metadata
+
+
+add_updated_at_trigger(NotebookEntry.__table__)
@@ -6,6 +6,7 @@ following PROMPT.md Step 1.5 specifications.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from datetime import timedelta
@@ -14,7 +15,7 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 
 
 class Token(BaseModel):
@@ -5,12 +5,12 @@ Implements feedback endpoints and processing workflows
 following PROMPT.md Step 3.3 specifications for unified feedback collection.
 """
 
-import hashlib
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends, status, Request, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ..utils.config import get_settings
@@ -20,17 +20,115 @@ from ..services.feedback_service import (
     FeedbackService,
     FeedbackChannel,
     FeedbackType,
-    FeedbackData
+    FeedbackData,
+    pseudonymize
 )
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/feedback", tags=["feedback"])
+# The app already defaults to ORJSONResponse, but a returned dict still goes
+# through jsonable_encoder first; the dict-heavy handlers below return
+# ORJSONResponse directly so orjson sees their payloads as-is
+router = APIRouter(prefix="/feedback", tags=["feedback"], default_response_class=ORJSONResponse)
 
 # Initialize services
 feedback_service = FeedbackService()
 
 
+# Feedback types never change at runtime, so the response is built once
+_FEEDBACK_TYPES_PAYLOAD = {
+    "status": "success",
+    "feedback_types": {
+        FeedbackType.RATING.value: {
+            "name": "Rating",
+            "description": "Numerical rating feedback (1-10 scale)",
+            "requires_rating": True,
+            "supports_notes": True
+        },
+        FeedbackType.OBSERVATION.value: {
+            "name": "Observation",
+            "description": "Detailed cooking observations and metrics",
+            "requires_rating": False,
+            "supports_notes": True
+        },
+        FeedbackType.OUTCOME.value: {
+            "name": "Outcome",
+            "description": "Final cooking results and analysis",
+            "requires_rating": False,
+            "supports_notes": True
+        },
+        FeedbackType.GENERAL.value: {
+            "name": "General",
+            "description": "General comments and feedback",
+            "requires_rating": False,
+            "supports_notes": True
+        }
+    }
+}
+
+
+# Only the "enabled" flags depend on settings, which are fixed for the life of
+# the process, so the channels payload is built on first use and reused
+@lru_cache(maxsize=1)
+def _build_channels_payload() -> Dict[str, Any]:
+    """Build the /feedback/channels response body."""
+    settings = get_settings()
+
+    channels = {
+        FeedbackChannel.SLACK.value: {
+            "name": "Slack",
+            "supports_structured": True,
+            "supports_interactive": True,
+            "supports_natural_language": True,
+            "enabled": bool(settings.slack.bot_token)
+        },
+        FeedbackChannel.TELEGRAM.value: {
+            "name": "Telegram",
+            "supports_structured": True,
+            "supports_interactive": True,
+            "supports_natural_language": True,
+            "enabled": bool(settings.telegram.bot_token)
+        },
+        FeedbackChannel.WHATSAPP.value: {
+            "name": "WhatsApp",
+            "supports_structured": False,
+            "supports_interactive": False,
+            "supports_natural_language": True,
+            "enabled": bool(settings.twilio.account_sid)
+        },
+        FeedbackChannel.SMS.value: {
+            "name": "SMS",
+            "supports_structured": False,
+            "supports_interactive": False,
+            "supports_natural_language": True,
+            "enabled": bool(settings.twilio.account_sid)
+        },
+        FeedbackChannel.EMAIL.value: {
+            "name": "Email",
+            "supports_structured": False,
+            "supports_interactive": False,
+            "supports_natural_language": True,
+            "enabled": bool(settings.email.smtp_host)
+        },
+        FeedbackChannel.WEB.value: {
+            "name": "Web Form",
+            "supports_structured": True,
+            "supports_interactive": True,
+            "supports_natural_language": True,
+            "enabled": True  # Always available
+        }
+    }
+
+    enabled_count = sum(1 for channel in channels.values() if channel["enabled"])
+
+    return {
+        "status": "success",
+        "total_channels": len(channels),
+        "enabled_channels": enabled_count,
+        "channels": channels
+    }
+
+
 class FeedbackSubmissionRequest(BaseModel):
     """Request to submit feedback for an entry."""
 
@@ -91,23 +189,13 @@ async def submit_feedback(
             feedback_type=request.feedback_type.value
         )
 
-        # Convert request to feedback data format
-        feedback_data = {
-            "feedback_type": request.feedback_type.value,
-            "rating_10": request.rating_10,
-            "doneness": request.doneness,
-            "salt": request.salt,
-            "smoke": request.smoke,
-            "crust": request.crust,
-            "internal_temp_c": request.internal_temp_c,
-            "rest_minutes": request.rest_minutes,
-            "notes": request.notes,
-            "issues": request.issues,
-            "fixes": request.fixes
-        }
-
-        # Remove None values
-        feedback_data = {k: v for k, v in feedback_data.items() if v is not None}
+        # Convert request to feedback data format, dropping unset fields;
+        # JSON mode turns feedback_type into its plain string value
+        feedback_data = request.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={"entry_id", "channel"}
+        )
 
         # Process feedback through service
         processed_feedback = await feedback_service.collect_feedback(
@@ -117,7 +205,8 @@ async def submit_feedback(
             feedback_data=feedback_data
         )
 
-        return FeedbackResponse(
+        # Built from the service's own record, so validation is skipped
+        return FeedbackResponse.model_construct(
             success=True,
             entry_id=processed_feedback.entry_id,
             user_id=processed_feedback.user_id,
@@ -156,7 +245,7 @@ async def receive_sms_feedback(
         )
 
         # Hash phone number for privacy
-        user_id = hashlib.sha256(From.encode()).hexdigest()[:12]
+        user_id = pseudonymize(From)
 
         # Process SMS through feedback service
         feedback_data = {"message": Body}
@@ -175,14 +264,11 @@ async def receive_sms_feedback(
         # Twilio expects XML response for SMS
         response_text = "Thank you for your feedback! We've recorded your comments."
 
-        return JSONResponse(
-            content={"message": response_text},
-            headers={"Content-Type": "application/json"}
-        )
+        return ORJSONResponse(content={"message": response_text})
 
     except Exception as e:
         logger.error(f"Error processing SMS feedback: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": "Failed to process feedback"},
             status_code=500
         )
@@ -211,7 +297,7 @@ async def receive_email_feedback(request: Request):
         body = payload.get("body", "")
 
         # Hash email for privacy
-        user_id = hashlib.sha256(from_email.encode()).hexdigest()[:12]
+        user_id = pseudonymize(from_email)
 
         # Combine subject and body for processing
         feedback_text = f"{subject}\n\n{body}"
@@ -227,11 +313,11 @@ async def receive_email_feedback(request: Request):
             feedback_data=feedback_data
         )
 
-        return {"status": "success", "message": "Email feedback processed"}
+        return ORJSONResponse(content={"status": "success", "message": "Email feedback processed"})
 
     except Exception as e:
         logger.error(f"Error processing email feedback: {e}")
-        return {"status": "error", "message": str(e)}
+        return ORJSONResponse(content={"status": "error", "message": str(e)})
 
 
 @router.get("/summary/{entry_id}")
@@ -254,10 +340,10 @@ async def get_feedback_summary(
 
         summary = await feedback_service.get_feedback_summary(entry_id)
 
-        return {
+        return ORJSONResponse(content={
             "status": "success",
             "summary": summary
-        }
+        })
 
     except Exception as e:
         logger.error(f"Error getting feedback summary: {e}")
@@ -281,10 +367,12 @@ async def trigger_feedback_collection(
     after the specified delay period.
     """
     try:
+        channel_values = [c.value for c in channels]
+
         logger.info(
             "Feedback collection trigger",
             entry_id=entry_id,
-            channels=[c.value for c in channels],
+            channels=channel_values,
             delay_minutes=delay_minutes,
             user=current_user.get("sub")
         )
@@ -296,13 +384,13 @@ async def trigger_feedback_collection(
             delay_minutes=delay_minutes
         )
 
-        return {
+        return ORJSONResponse(content={
             "status": "success",
-            "message": f"Feedback collection scheduled for {len(channels)} channels",
+            "message": f"Feedback collection scheduled for {len(channel_values)} channels",
             "entry_id": entry_id,
             "delay_minutes": delay_minutes,
-            "channels": [c.value for c in channels]
-        }
+            "channels": channel_values
+        })
 
     except Exception as e:
         logger.error(f"Error triggering feedback collection: {e}")
@@ -321,61 +409,7 @@ async def get_feedback_channels():
     their features, and current configuration status.
     """
     try:
-        settings = get_settings()
-
-        channels = {
-            FeedbackChannel.SLACK.value: {
-                "name": "Slack",
-                "supports_structured": True,
-                "supports_interactive": True,
-                "supports_natural_language": True,
-                "enabled": bool(settings.slack.bot_token)
-            },
-            FeedbackChannel.TELEGRAM.value: {
-                "name": "Telegram",
-                "supports_structured": True,
-                "supports_interactive": True,
-                "supports_natural_language": True,
-                "enabled": bool(settings.telegram.bot_token)
-            },
-            FeedbackChannel.WHATSAPP.value: {
-                "name": "WhatsApp",
-                "supports_structured": False,
-                "supports_interactive": False,
-                "supports_natural_language": True,
-                "enabled": bool(settings.twilio.account_sid)
-            },
-            FeedbackChannel.SMS.value: {
-                "name": "SMS",
-                "supports_structured": False,
-                "supports_interactive": False,
-                "supports_natural_language": True,
-                "enabled": bool(settings.twilio.account_sid)
-            },
-            FeedbackChannel.EMAIL.value: {
-                "name": "Email",
-                "supports_structured": False,
-                "supports_interactive": False,
-                "supports_natural_language": True,
-                "enabled": bool(settings.email.smtp_host)
-            },
-            FeedbackChannel.WEB.value: {
-                "name": "Web Form",
-                "supports_structured": True,
-                "supports_interactive": True,
-                "supports_natural_language": True,
-                "enabled": True  # Always available
-            }
-        }
-
-        enabled_count = sum(1 for channel in channels.values() if channel["enabled"])
-
-        return {
-            "status": "success",
-            "total_channels": len(channels),
-            "enabled_channels": enabled_count,
-            "channels": channels
-        }
+        return ORJSONResponse(content=_build_channels_payload())
 
     except Exception as e:
         logger.error(f"Error getting feedback channels: {e}")
@@ -393,37 +427,7 @@ async def get_feedback_types():
     Returns information about supported feedback types
     and their intended use cases.
     """
-    feedback_types = {
-        FeedbackType.RATING.value: {
-            "name": "Rating",
-            "description": "Numerical rating feedback (1-10 scale)",
-            "requires_rating": True,
-            "supports_notes": True
-        },
-        FeedbackType.OBSERVATION.value: {
-            "name": "Observation",
-            "description": "Detailed cooking observations and metrics",
-            "requires_rating": False,
-            "supports_notes": True
-        },
-        FeedbackType.OUTCOME.value: {
-            "name": "Outcome",
-            "description": "Final cooking results and analysis",
-            "requires_rating": False,
-            "supports_notes": True
-        },
-        FeedbackType.GENERAL.value: {
-            "name": "General",
-            "description": "General comments and feedback",
-            "requires_rating": False,
-            "supports_notes": True
-        }
-    }
-
-    return {
-        "status": "success",
-        "feedback_types": feedback_types
-    }
+    return ORJSONResponse(content=_FEEDBACK_TYPES_PAYLOAD)
 
 
 @router.get("/health")
@@ -6,7 +6,7 @@ authentication, input validation, error handling, and idempotency.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Header, Body, status
@@ -23,6 +23,7 @@ from ..utils.auth import (
     RateLimit
 )
 from ..services.mcp_server import MCPServer
+from ..models.mcp import CallToolResponse, ErrorContent, JsonContent
 
 
 logger = get_logger(__name__)
@@ -43,6 +44,20 @@ router = APIRouter(
 )
 
 
+def _tool_error(tool_response: CallToolResponse, default_code: str) -> Tuple[str, str]:
+    """Return ``(code, message)`` from the first item of a failed tool call."""
+    item = tool_response.content[0] if tool_response.content else None
+    if isinstance(item, ErrorContent):
+        return item.code or default_code, item.error
+    return default_code, "Unknown error"
+
+
+def _tool_json(tool_response: CallToolResponse) -> Dict[str, Any]:
+    """Return the JSON payload from the first item of a tool call."""
+    item = tool_response.content[0] if tool_response.content else None
+    return item.json if isinstance(item, JsonContent) else {}
+
+
 # Request/Response Models
 class AppendObservationRequest(BaseModel):
     """Request model for appending observations."""
@@ -307,9 +322,7 @@ async def append_observation(
 
         if tool_response.isError:
             # Extract error from tool response
-            error_content = tool_response.content[0] if tool_response.content else {}
-            error_code = error_content.get("code", "E_IO")
-            error_message = error_content.get("error", "Unknown error")
+            error_code, error_message = _tool_error(tool_response, "E_IO")
 
             if error_code == "E_NOT_FOUND":
                 raise FileNotFoundError(error_message)
@@ -319,8 +332,7 @@ async def append_observation(
                 raise Exception(error_message)
 
         # Extract result data
-        result_data = tool_response.content[0] if tool_response.content else {}
-        json_data = result_data.get("json", {})
+        json_data = _tool_json(tool_response)
 
         response = MCPResponse(
             status="success",
@@ -423,9 +435,7 @@ async def update_outcomes(
 
         if tool_response.isError:
             # Extract error from tool response
-            error_content = tool_response.content[0] if tool_response.content else {}
-            error_code = error_content.get("code", "E_IO")
-            error_message = error_content.get("error", "Unknown error")
+            error_code, error_message = _tool_error(tool_response, "E_IO")
 
             if error_code == "E_NOT_FOUND":
                 raise FileNotFoundError(error_message)
@@ -435,8 +445,7 @@ async def update_outcomes(
                 raise Exception(error_message)
 
         # Extract result data
-        result_data = tool_response.content[0] if tool_response.content else {}
-        json_data = result_data.get("json", {})
+        json_data = _tool_json(tool_response)
 
         response = MCPResponse(
             status="success",
@@ -536,9 +545,7 @@ async def create_entry(
 
         if tool_response.isError:
             # Extract error from tool response
-            error_content = tool_response.content[0] if tool_response.content else {}
-            error_code = error_content.get("code", "E_IO")
-            error_message = error_content.get("error", "Unknown error")
+            error_code, error_message = _tool_error(tool_response, "E_IO")
 
             if error_code == "E_SCHEMA":
                 raise ValueError(error_message)
@@ -546,8 +553,7 @@ async def create_entry(
                 raise Exception(error_message)
 
         # Extract result data
-        result_data = tool_response.content[0] if tool_response.content else {}
-        json_data = result_data.get("json", {})
+        json_data = _tool_json(tool_response)
 
         response = MCPResponse(
             status="success",
@@ -842,9 +848,7 @@ async def synthesize_ics(
 
         if tool_response.isError:
             # Extract error from tool response
-            error_content = tool_response.content[0] if tool_response.content else {}
-            error_code = error_content.get("code", "E_IO")
-            error_message = error_content.get("error", "Unknown error")
+            error_code, error_message = _tool_error(tool_response, "E_IO")
 
             if error_code == "E_NOT_FOUND":
                 raise FileNotFoundError(error_message)
@@ -854,8 +858,7 @@ async def synthesize_ics(
                 raise Exception(error_message)
 
         # Extract result data
-        result_data = tool_response.content[0] if tool_response.content else {}
-        json_data = result_data.get("json", {})
+        json_data = _tool_json(tool_response)
 
         response = MCPResponse(
             status="success",
@@ -951,14 +954,11 @@ async def git_commit(
 
         if tool_response.isError:
             # Extract error from tool response
-            error_content = tool_response.content[0] if tool_response.content else {}
-            error_code = error_content.get("code", "E_GIT")
-            error_message = error_content.get("error", "Unknown error")
+            error_code, error_message = _tool_error(tool_response, "E_GIT")
             raise Exception(error_message)
 
         # Extract result data
-        result_data = tool_response.content[0] if tool_response.content else {}
-        json_data = result_data.get("json", {})
+        json_data = _tool_json(tool_response)
 
         response = MCPResponse(
             status=json_data.get("status", "success"),
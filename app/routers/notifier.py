@@ -22,7 +22,7 @@ from ..services.notifier_service import (
     NotificationRequest,
     NotificationTemplate
 )
-from ..services.feedback_service import FeedbackService, FeedbackChannel
+from ..services.feedback_service import FeedbackService, FeedbackChannel, pseudonymize
 
 logger = get_logger(__name__)
 
@@ -202,8 +202,7 @@ async def whatsapp_webhook(request: Request):
             feedback_data = {"message": body}
 
             # Use phone number as user ID (hashed for privacy)
-            import hashlib
-            user_id = hashlib.sha256(from_number.encode()).hexdigest()[:12]
+            user_id = pseudonymize(from_number)
 
             logger.info(f"Received feedback message from WhatsApp user {user_id}")
 
@@ -242,8 +241,7 @@ async def sms_webhook(request: Request):
             feedback_data = {"message": body}
 
             # Use phone number as user ID (hashed for privacy)
-            import hashlib
-            user_id = hashlib.sha256(from_number.encode()).hexdigest()[:12]
+            user_id = pseudonymize(from_number)
 
             logger.info(f"Received feedback message from SMS user {user_id}")
 
@@ -12,6 +12,7 @@ from passlib.context import CryptContext
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from ..utils.config import get_settings
+from .auth_cache import TokenClaimsCache
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +32,10 @@ class AuthService:
         self.secret_key = settings.auth.secret_key
         self.algorithm = settings.auth.algorithm
         self.access_token_expire_minutes = settings.auth.access_token_expire_minutes
+        self.claims_cache = TokenClaimsCache(
+            maxsize=settings.auth.token_cache_size,
+            ttl=settings.auth.token_cache_ttl
+        )
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
@@ -62,6 +67,11 @@ class AuthService:
 
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify and decode a JWT token."""
+        cache_key = self.claims_cache.key(token)
+        cached = self.claims_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             username: str = payload.get("sub")
@@ -73,6 +83,7 @@ class AuthService:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
+            self.claims_cache.set(cache_key, payload)
             return payload
 
         except JWTError as e:
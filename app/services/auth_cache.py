@@ -0,0 +1,61 @@
+"""
+Short-lived cache of verified JWT claims.
+
+Keyed by the SHA-256 digest of the raw token, so tokens themselves are never
+held in memory; entries expire after a few seconds or at the token's own
+``exp``, whichever comes first.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class TokenClaimsCache:
+    """Bounded LRU cache of decoded token claims with a per-entry deadline."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Cache key for a raw token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return cached claims for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, deadline = entry
+            if time.time() >= deadline:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Copy so callers cannot alter what later requests are handed
+        return dict(claims)
+
+    def set(self, key: bytes, claims: Dict[str, Any]) -> None:
+        """Remember verified claims until the TTL or the token's ``exp``."""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        deadline = time.time() + self.ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            deadline = min(deadline, exp)
+        with self._lock:
+            self._entries[key] = (dict(claims), deadline)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
@@ -20,7 +20,7 @@ import aiosmtplib
 from ..utils.config import get_settings
 from ..utils.logging import get_logger
 from ..services.mcp_server import MCPServer
-from ..services.feedback_service import FeedbackService, FeedbackChannel
+from ..services.feedback_service import FeedbackService, FeedbackChannel, pseudonymize
 
 
 logger = get_logger(__name__)
@@ -252,7 +252,7 @@ You can reply directly to this email to submit feedback.
         """Process incoming email reply for feedback collection."""
         try:
             # Hash email for privacy
-            user_id = hashlib.sha256(from_email.encode()).hexdigest()[:12]
+            user_id = pseudonymize(from_email)
 
             logger.info(f"Processing email reply from {user_id}: {subject}")
 
@@ -19,6 +19,22 @@ from ..services.feedback_service import FeedbackChannel
 
 logger = get_logger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_STAR_RE = re.compile(r'⭐|★')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Common abbreviations, expanded in this order
+_ABBREVIATIONS = (
+    (re.compile(r'\bu\b', re.IGNORECASE), 'you'),
+    (re.compile(r'\bur\b', re.IGNORECASE), 'your'),
+    (re.compile(r'\btho\b', re.IGNORECASE), 'though'),
+    (re.compile(r'\bw/\b', re.IGNORECASE), 'with'),
+    (re.compile(r'\bw/o\b', re.IGNORECASE), 'without'),
+    (re.compile(r'\btbh\b', re.IGNORECASE), 'to be honest'),
+    (re.compile(r'\bimo\b', re.IGNORECASE), 'in my opinion'),
+    (re.compile(r'\bomg\b', re.IGNORECASE), 'oh my god'),
+)
+
 
 class FeedbackConfidence(str, Enum):
     """Confidence levels for extracted feedback."""
@@ -73,20 +89,20 @@ class FeedbackNormalizer:
         """Initialize feedback normalizer."""
         self.logger = get_logger(__name__)
 
-        # Rating extraction patterns (ordered by specificity)
+        # Rating extraction patterns (ordered by specificity), compiled once
         self.rating_patterns = [
             # Explicit rating patterns
-            (r'\b(\d{1,2})\s*(?:out\s*of\s*|\/)?\s*10\b', "explicit_scale"),
-            (r'\brat(?:e|ed|ing)[\s:]*(\d{1,2})\b', "explicit_rating"),
-            (r'\bscore[\s:]*(\d{1,2})\b', "explicit_score"),
-            (r'\bgive\s+it\s+(?:a\s+)?(\d{1,2})\b', "explicit_give"),
+            (re.compile(r'\b(\d{1,2})\s*(?:out\s*of\s*|\/)?\s*10\b', re.IGNORECASE), "explicit_scale"),
+            (re.compile(r'\brat(?:e|ed|ing)[\s:]*(\d{1,2})\b', re.IGNORECASE), "explicit_rating"),
+            (re.compile(r'\bscore[\s:]*(\d{1,2})\b', re.IGNORECASE), "explicit_score"),
+            (re.compile(r'\bgive\s+it\s+(?:a\s+)?(\d{1,2})\b', re.IGNORECASE), "explicit_give"),
 
             # Star-based ratings
-            (r'(\d{1,2})\s*(?:stars?|⭐|★)', "star_rating"),
-            (r'(⭐|★){1,10}', "emoji_stars"),
+            (re.compile(r'(\d{1,2})\s*(?:stars?|⭐|★)', re.IGNORECASE), "star_rating"),
+            (re.compile(r'(⭐|★){1,10}', re.IGNORECASE), "emoji_stars"),
 
             # Contextual ratings
-            (r'\b(\d{1,2})\s*(?:/|out of)?\s*(?:5|10)?\b', "numeric_context"),
+            (re.compile(r'\b(\d{1,2})\s*(?:/|out of)?\s*(?:5|10)?\b', re.IGNORECASE), "numeric_context"),
         ]
 
         # Sentiment word mappings
@@ -125,10 +141,10 @@ class FeedbackNormalizer:
 
         # Cooking metrics patterns
         self.metrics_patterns = {
-            "internal_temp": r'\b(\d+)°?\s*(?:degrees?|°)?\s*(?:f|fahrenheit|c|celsius)?\b',
-            "cook_time": r'\b(\d+)\s*(?:min(?:ute)?s?|hrs?|hours?)\b',
-            "rest_time": r'\brest(?:ed)?\s*(\d+)\s*(?:min(?:ute)?s?)\b',
-            "servings": r'\b(\d+)\s*(?:servings?|people|portions?)\b'
+            "internal_temp": re.compile(r'\b(\d+)°?\s*(?:degrees?|°)?\s*(?:f|fahrenheit|c|celsius)?\b', re.IGNORECASE),
+            "cook_time": re.compile(r'\b(\d+)\s*(?:min(?:ute)?s?|hrs?|hours?)\b', re.IGNORECASE),
+            "rest_time": re.compile(r'\brest(?:ed)?\s*(\d+)\s*(?:min(?:ute)?s?)\b', re.IGNORECASE),
+            "servings": re.compile(r'\b(\d+)\s*(?:servings?|people|portions?)\b', re.IGNORECASE)
         }
 
         # Category keywords
@@ -224,22 +240,11 @@ class FeedbackNormalizer:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for processing."""
         # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', text).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', text).strip()
 
         # Normalize common abbreviations
-        replacements = {
-            r'\bu\b': 'you',
-            r'\bur\b': 'your',
-            r'\btho\b': 'though',
-            r'\bw/\b': 'with',
-            r'\bw/o\b': 'without',
-            r'\btbh\b': 'to be honest',
-            r'\bimo\b': 'in my opinion',
-            r'\bomg\b': 'oh my god'
-        }
-
-        for pattern, replacement in replacements.items():
-            cleaned = re.sub(pattern, replacement, cleaned, flags=re.IGNORECASE)
+        for pattern, replacement in _ABBREVIATIONS:
+            cleaned = pattern.sub(replacement, cleaned)
 
         return cleaned
 
@@ -248,12 +253,12 @@ class FeedbackNormalizer:
 
         # Try explicit rating patterns first
         for pattern, source in self.rating_patterns:
-            match = re.search(pattern, cleaned_text, re.IGNORECASE)
+            match = pattern.search(cleaned_text)
             if match:
                 try:
                     if source == "emoji_stars":
                         # Count star emojis
-                        stars = len(re.findall(r'⭐|★', match.group(0)))
+                        stars = len(_STAR_RE.findall(match.group(0)))
                         if 1 <= stars <= 10:
                             return NormalizedRating(
                                 value=stars,
@@ -338,7 +343,7 @@ class FeedbackNormalizer:
         metrics = {}
 
         for metric_name, pattern in self.metrics_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             if matches:
                 try:
                     # Take the first numeric match
@@ -367,7 +372,7 @@ class FeedbackNormalizer:
         # In production, would use more sophisticated NLP
 
         # Split into sentences and filter meaningful ones
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         key_phrases = []
 
         for sentence in sentences:
@@ -6,20 +6,36 @@ PROMPT.md Step 3.3 specifications for multi-channel feedback collection.
 """
 
 import asyncio
+import hashlib
 import json
+import re
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Union
 from enum import Enum
+from functools import lru_cache
 
+import orjson
+import redis.asyncio as redis
 from pydantic import BaseModel, Field, validator
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from ..models import get_session, NotebookEntry, Feedback
+from ..models import get_session, NotebookEntry, Feedback, User
 from ..services.mcp_server import MCPServer
 from ..utils.config import get_settings
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Feedback summaries are cached in Redis for this many seconds; new feedback
+# for an entry drops its cached summary straight away
+SUMMARY_CACHE_TTL = 60
+
+# Text patterns used on every incoming message, compiled once
+_ENTRY_ID_RE = re.compile(r'^[0-9]{4}-[0-9]{2}-[0-9]{2}_[a-z0-9-]{1,50}$')
+_SMS_RATING_RE = re.compile(r'(\d+)/10|(\d+)\s*(?:star|★)')
+_SMS_TEMP_RE = re.compile(r'(\d+)°?[cf]')
+
 # Import normalizer (lazy import to avoid circular dependencies)
 _normalizer = None
 
@@ -31,6 +47,17 @@ def get_normalizer():
     return _normalizer
 
 
+@lru_cache(maxsize=1024)
+def pseudonymize(identifier: str) -> str:
+    """
+    Map a phone number or email address to a stable 12-character user ID.
+
+    A family's handful of senders repeat constantly, so results are cached;
+    the mapping is deterministic and never needs invalidating.
+    """
+    return hashlib.sha256(identifier.encode()).hexdigest()[:12]
+
+
 class FeedbackChannel(str, Enum):
     """Feedback collection channels."""
     SLACK = "slack"
@@ -83,8 +110,7 @@ class FeedbackData(BaseModel):
     @validator('entry_id')
     def validate_entry_id(cls, v):
         """Validate entry ID format."""
-        import re
-        if not re.match(r'^[0-9]{4}-[0-9]{2}-[0-9]{2}_[a-z0-9-]{1,50}$', v):
+        if not _ENTRY_ID_RE.match(v):
             raise ValueError('Invalid entry ID format')
         return v
 
@@ -95,6 +121,30 @@ class FeedbackService:
     def __init__(self):
         self.settings = get_settings()
         self.mcp_server = MCPServer()
+        self._redis: Optional[redis.Redis] = None
+
+    def _get_redis(self) -> redis.Redis:
+        """Get the Redis client, creating its connection pool on first use."""
+        if self._redis is None:
+            self._redis = redis.from_url(
+                str(self.settings.redis.url),
+                max_connections=self.settings.redis.max_connections,
+                socket_timeout=self.settings.redis.socket_timeout,
+                socket_connect_timeout=self.settings.redis.socket_connect_timeout,
+                retry_on_timeout=self.settings.redis.retry_on_timeout
+            )
+        return self._redis
+
+    @staticmethod
+    def _summary_cache_key(entry_id: str) -> str:
+        return f"fbsum:{entry_id}"
+
+    async def _invalidate_summary(self, entry_id: str) -> None:
+        """Drop the cached feedback summary for an entry."""
+        try:
+            await self._get_redis().delete(self._summary_cache_key(entry_id))
+        except redis.RedisError as e:
+            logger.warning(f"Could not invalidate feedback summary cache: {e}")
 
     async def collect_feedback(
         self,
@@ -138,6 +188,7 @@ class FeedbackService:
 
             # Store feedback in database
             await self._store_feedback(feedback)
+            await self._invalidate_summary(entry_id)
 
             # Update notebook entry via MCP
             await self._update_entry_via_mcp(feedback)
@@ -210,8 +261,7 @@ class FeedbackService:
         }
 
         # Simple NLP for rating extraction
-        import re
-        rating_match = re.search(r'(\d+)/10|(\d+)\s*(?:star|★)', message)
+        rating_match = _SMS_RATING_RE.search(message)
         if rating_match:
             rating = int(rating_match.group(1) or rating_match.group(2))
             if 1 <= rating <= 10:
@@ -219,7 +269,7 @@ class FeedbackService:
                 normalized["feedback_type"] = FeedbackType.RATING
 
         # Extract temperature mentions
-        temp_match = re.search(r'(\d+)°?[cf]', message)
+        temp_match = _SMS_TEMP_RE.search(message)
         if temp_match:
             temp = int(temp_match.group(1))
             # Convert F to C if needed
@@ -293,6 +343,38 @@ class FeedbackService:
             logger.error(f"Error storing feedback: {e}")
             raise
 
+    async def store_feedback_batch(
+        self,
+        users: List[Dict[str, Any]],
+        feedback_rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Store a batch of feedback in one transaction, creating missing users.
+
+        Users are upserted (existing IDs are left alone) and feedback rows
+        inserted, each as a single multi-row statement, with one COMMIT for
+        the whole batch, so a channel worker's cost no longer grows with
+        one round trip per message.
+
+        Args:
+            users: User column dicts; each must include ``id``
+            feedback_rows: Feedback column dicts, as for ``Feedback.bulk_insert``
+
+        Returns:
+            Number of feedback rows stored
+        """
+        async with get_session() as session:
+            if users:
+                insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+                await session.execute(
+                    insert(User).on_conflict_do_nothing(index_elements=[User.id]),
+                    users
+                )
+            await Feedback.bulk_insert(session, feedback_rows)
+
+        logger.info(f"Stored feedback batch: {len(feedback_rows)} rows")
+        return len(feedback_rows)
+
     async def _update_entry_via_mcp(self, feedback: FeedbackData):
         """Update notebook entry via MCP tools."""
         try:
@@ -326,7 +408,31 @@ class FeedbackService:
             # Don't raise - feedback is still stored in database
 
     async def get_feedback_summary(self, entry_id: str) -> Dict[str, Any]:
-        """Get feedback summary for an entry."""
+        """
+        Get feedback summary for an entry.
+
+        Served from Redis when a summary younger than SUMMARY_CACHE_TTL is
+        cached; Redis being unavailable only costs the cache, not the request.
+        """
+        key = self._summary_cache_key(entry_id)
+        try:
+            cached = await self._get_redis().get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except redis.RedisError as e:
+            logger.warning(f"Feedback summary cache unavailable: {e}")
+
+        summary = await self._build_feedback_summary(entry_id)
+
+        try:
+            await self._get_redis().setex(key, SUMMARY_CACHE_TTL, orjson.dumps(summary))
+        except redis.RedisError as e:
+            logger.warning(f"Could not cache feedback summary: {e}")
+
+        return summary
+
+    async def _build_feedback_summary(self, entry_id: str) -> Dict[str, Any]:
+        """Aggregate the stored feedback for an entry."""
         try:
             async with get_session() as session:
                 # Query feedback for entry
@@ -11,13 +11,14 @@ This module provides a complete MCP v0.1.0 compliant server with:
 """
 
 import asyncio
-import json
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs
 
+import orjson
+
 from ..models.mcp import (
     # Base protocol models
     MCPError, MCPRequest, MCPResponse,
@@ -39,7 +40,8 @@ from ..models.mcp import (
     # Schemas and utilities
     APPEND_OBSERVATION_SCHEMA, UPDATE_OUTCOMES_SCHEMA, CREATE_ENTRY_SCHEMA,
     GIT_COMMIT_SCHEMA, SYNTHESIZE_ICS_SCHEMA,
-    ErrorCode, create_error_response, create_text_content, create_json_content,
+    E_GIT, E_IO, E_NOT_FOUND, E_SCHEMA,
+    create_error_content, create_error_response, create_text_content, create_json_content,
     validate_entry_id, validate_uri_path
 )
 from ..models import NotebookEntry, get_session
@@ -51,6 +53,41 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Tool descriptors never change, so they are built and validated once
+TOOLS: Tuple[MCPTool, ...] = (
+    MCPTool(
+        name="append_observation",
+        description="Add a timestamped observation to a notebook entry with optional temperature readings",
+        inputSchema=APPEND_OBSERVATION_SCHEMA
+    ),
+    MCPTool(
+        name="update_outcomes",
+        description="Update the outcomes section of a notebook entry with ratings, issues, and fixes",
+        inputSchema=UPDATE_OUTCOMES_SCHEMA
+    ),
+    MCPTool(
+        name="create_entry",
+        description="Create a new notebook entry with title, tags, gear, and dinner time",
+        inputSchema=CREATE_ENTRY_SCHEMA
+    ),
+    MCPTool(
+        name="git_commit",
+        description="Commit changes to the Git repository with a custom message",
+        inputSchema=GIT_COMMIT_SCHEMA
+    ),
+    MCPTool(
+        name="synthesize_ics",
+        description="Generate an ICS calendar file for a notebook entry with timing information",
+        inputSchema=SYNTHESIZE_ICS_SCHEMA
+    )
+)
+
+
+def _dump_json(data: Any) -> str:
+    """Render resource content as indented JSON text."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
 class MCPServerError(Exception):
     """Base exception for MCP server errors."""
     pass
@@ -170,7 +207,7 @@ class MCPServer:
                 logger.warning(f"Error fetching entries for resource list: {e}")
 
             logger.info(f"Listed {len(resources)} MCP resources")
-            return ListResourcesResponse(resources=resources)
+            return ListResourcesResponse.construct_trusted(resources=resources)
 
         except Exception as e:
             logger.error(f"Error listing resources: {e}")
@@ -276,7 +313,7 @@ class MCPServer:
             return MCPResourceContent(
                 uri="lab://entries",
                 mimeType="application/json",
-                text=json.dumps(content, indent=2, default=str)
+                text=_dump_json(content)
             )
 
         except Exception as e:
@@ -286,8 +323,10 @@ class MCPServer:
     async def _get_entry_resource(self, entry_id: str) -> MCPResourceContent:
         """Get specific entry resource."""
         try:
-            if not validate_entry_id(entry_id):
+            valid_id = validate_entry_id(entry_id)
+            if not valid_id:
                 raise MCPServerError("Invalid entry ID format")
+            entry_id = valid_id
 
             entry = await self.notebook_service.get_entry(
                 entry_id,
@@ -318,7 +357,7 @@ class MCPServer:
             return MCPResourceContent(
                 uri=f"lab://entry/{entry_id}",
                 mimeType="application/json",
-                text=json.dumps(entry_data, indent=2, default=str)
+                text=_dump_json(entry_data)
             )
 
         except MCPServerError:
@@ -330,8 +369,10 @@ class MCPServer:
     async def _get_attachments_resource(self, entry_id: str) -> MCPResourceContent:
         """Get attachments resource for an entry."""
         try:
-            if not validate_entry_id(entry_id):
+            valid_id = validate_entry_id(entry_id)
+            if not valid_id:
                 raise MCPServerError("Invalid entry ID format")
+            entry_id = valid_id
 
             # Check if entry exists
             entry = await self.notebook_service.get_entry(entry_id, increment_view_count=False)
@@ -371,7 +412,7 @@ class MCPServer:
             return MCPResourceContent(
                 uri=f"lab://attachments/{entry_id}/",
                 mimeType="application/json",
-                text=json.dumps(content, indent=2, default=str)
+                text=_dump_json(content)
             )
 
         except MCPServerError:
@@ -447,7 +488,7 @@ class MCPServer:
             return MCPResourceContent(
                 uri=f"lab://search?q={query}",
                 mimeType="application/json",
-                text=json.dumps(content, indent=2, default=str)
+                text=_dump_json(content)
             )
 
         except Exception as e:
@@ -464,33 +505,7 @@ class MCPServer:
             List of available tools
         """
         try:
-            tools = [
-                MCPTool(
-                    name="append_observation",
-                    description="Add a timestamped observation to a notebook entry with optional temperature readings",
-                    inputSchema=APPEND_OBSERVATION_SCHEMA
-                ),
-                MCPTool(
-                    name="update_outcomes",
-                    description="Update the outcomes section of a notebook entry with ratings, issues, and fixes",
-                    inputSchema=UPDATE_OUTCOMES_SCHEMA
-                ),
-                MCPTool(
-                    name="create_entry",
-                    description="Create a new notebook entry with title, tags, gear, and dinner time",
-                    inputSchema=CREATE_ENTRY_SCHEMA
-                ),
-                MCPTool(
-                    name="git_commit",
-                    description="Commit changes to the Git repository with a custom message",
-                    inputSchema=GIT_COMMIT_SCHEMA
-                ),
-                MCPTool(
-                    name="synthesize_ics",
-                    description="Generate an ICS calendar file for a notebook entry with timing information",
-                    inputSchema=SYNTHESIZE_ICS_SCHEMA
-                )
-            ]
+            tools = list(TOOLS)
 
             logger.info(f"Listed {len(tools)} MCP tools")
             return tools
@@ -532,15 +547,15 @@ class MCPServer:
             logger.info(f"Tool {name} completed in {duration_ms:.2f}ms")
 
             return CallToolResponse(
-                content=[result.dict()],
+                content=[result],
                 isError=False
             )
 
         except Exception as e:
             logger.error(f"Error calling tool {name}: {e}")
-            error_content = create_error_content(str(e), ErrorCode.E_IO.value)
+            error_content = create_error_content(str(e), E_IO)
             return CallToolResponse(
-                content=[error_content.dict()],
+                content=[error_content],
                 isError=True
             )
 
@@ -548,7 +563,7 @@ class MCPServer:
         """Handle append_observation tool call."""
         try:
             # Validate input
-            input_data = AppendObservationInput(**arguments)
+            input_data = AppendObservationInput.model_validate(arguments)
 
             # Build observation data
             observation = {
@@ -570,7 +585,7 @@ class MCPServer:
             )
 
             if not success:
-                return create_error_content(f"Entry not found: {input_data.id}", ErrorCode.E_NOT_FOUND.value)
+                return create_error_content(f"Entry not found: {input_data.id}", E_NOT_FOUND)
 
             # Get updated entry for response
             entry = await self.notebook_service.get_entry(input_data.id, increment_view_count=False)
@@ -584,18 +599,18 @@ class MCPServer:
             })
 
         except NotebookNotFoundError:
-            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", ErrorCode.E_NOT_FOUND.value)
+            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", E_NOT_FOUND)
         except (ValueError, TypeError) as e:
-            return create_error_content(f"Invalid input: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Invalid input: {str(e)}", E_SCHEMA)
         except Exception as e:
             logger.error(f"Error in append_observation: {e}")
-            return create_error_content(f"Operation failed: {str(e)}", ErrorCode.E_IO.value)
+            return create_error_content(f"Operation failed: {str(e)}", E_IO)
 
     async def _handle_update_outcomes(self, arguments: Dict[str, Any]) -> Union[JsonContent, ErrorContent]:
         """Handle update_outcomes tool call."""
         try:
             # Validate input
-            input_data = UpdateOutcomesInput(**arguments)
+            input_data = UpdateOutcomesInput.model_validate(arguments)
 
             # Update outcomes
             success = await self.notebook_service.update_outcomes(
@@ -606,7 +621,7 @@ class MCPServer:
             )
 
             if not success:
-                return create_error_content(f"Entry not found: {input_data.id}", ErrorCode.E_NOT_FOUND.value)
+                return create_error_content(f"Entry not found: {input_data.id}", E_NOT_FOUND)
 
             # Get updated entry for response
             entry = await self.notebook_service.get_entry(input_data.id, increment_view_count=False)
@@ -620,18 +635,18 @@ class MCPServer:
             })
 
         except NotebookNotFoundError:
-            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", ErrorCode.E_NOT_FOUND.value)
+            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", E_NOT_FOUND)
         except (ValueError, TypeError) as e:
-            return create_error_content(f"Invalid input: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Invalid input: {str(e)}", E_SCHEMA)
         except Exception as e:
             logger.error(f"Error in update_outcomes: {e}")
-            return create_error_content(f"Operation failed: {str(e)}", ErrorCode.E_IO.value)
+            return create_error_content(f"Operation failed: {str(e)}", E_IO)
 
     async def _handle_create_entry(self, arguments: Dict[str, Any]) -> Union[JsonContent, ErrorContent]:
         """Handle create_entry tool call."""
         try:
             # Validate input
-            input_data = CreateEntryInput(**arguments)
+            input_data = CreateEntryInput.model_validate(arguments)
 
             # Build entry data
             entry_data = {
@@ -662,18 +677,18 @@ class MCPServer:
             })
 
         except NotebookValidationError as e:
-            return create_error_content(f"Validation error: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Validation error: {str(e)}", E_SCHEMA)
         except (ValueError, TypeError) as e:
-            return create_error_content(f"Invalid input: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Invalid input: {str(e)}", E_SCHEMA)
         except Exception as e:
             logger.error(f"Error in create_entry: {e}")
-            return create_error_content(f"Operation failed: {str(e)}", ErrorCode.E_IO.value)
+            return create_error_content(f"Operation failed: {str(e)}", E_IO)
 
     async def _handle_git_commit(self, arguments: Dict[str, Any]) -> Union[JsonContent, ErrorContent]:
         """Handle git_commit tool call."""
         try:
             # Validate input
-            input_data = GitCommitInput(**arguments)
+            input_data = GitCommitInput.model_validate(arguments)
 
             # Create commit
             commit_sha = await self.git_service.commit_changes(
@@ -698,23 +713,23 @@ class MCPServer:
             })
 
         except GitOperationError as e:
-            return create_error_content(f"Git operation failed: {str(e)}", ErrorCode.E_GIT.value)
+            return create_error_content(f"Git operation failed: {str(e)}", E_GIT)
         except (ValueError, TypeError) as e:
-            return create_error_content(f"Invalid input: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Invalid input: {str(e)}", E_SCHEMA)
         except Exception as e:
             logger.error(f"Error in git_commit: {e}")
-            return create_error_content(f"Operation failed: {str(e)}", ErrorCode.E_IO.value)
+            return create_error_content(f"Operation failed: {str(e)}", E_IO)
 
     async def _handle_synthesize_ics(self, arguments: Dict[str, Any]) -> Union[JsonContent, ErrorContent]:
         """Handle synthesize_ics tool call."""
         try:
             # Validate input
-            input_data = SynthesizeICSInput(**arguments)
+            input_data = SynthesizeICSInput.model_validate(arguments)
 
             # Get entry
             entry = await self.notebook_service.get_entry(input_data.id, increment_view_count=False)
             if not entry:
-                return create_error_content(f"Entry not found: {input_data.id}", ErrorCode.E_NOT_FOUND.value)
+                return create_error_content(f"Entry not found: {input_data.id}", E_NOT_FOUND)
 
             # Generate ICS content
             ics_content = await self._generate_ics_content(entry, input_data.lead_minutes)
@@ -739,12 +754,12 @@ class MCPServer:
             })
 
         except NotebookNotFoundError:
-            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", ErrorCode.E_NOT_FOUND.value)
+            return create_error_content(f"Entry not found: {arguments.get('id', 'unknown')}", E_NOT_FOUND)
         except (ValueError, TypeError) as e:
-            return create_error_content(f"Invalid input: {str(e)}", ErrorCode.E_SCHEMA.value)
+            return create_error_content(f"Invalid input: {str(e)}", E_SCHEMA)
         except Exception as e:
             logger.error(f"Error in synthesize_ics: {e}")
-            return create_error_content(f"Operation failed: {str(e)}", ErrorCode.E_IO.value)
+            return create_error_content(f"Operation failed: {str(e)}", E_IO)
 
     async def _generate_ics_content(self, entry: NotebookEntry, lead_minutes: int = 60) -> str:
         """Generate ICS calendar content for an entry."""
@@ -16,10 +16,13 @@ from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
-from ..models import NotebookEntry, Feedback, User, get_session
+from ..models import NotebookEntry, EntryViewCount, Feedback, User, get_session
 from .git_service import GitService
 from ..utils.config import get_settings
 
@@ -95,7 +98,15 @@ class NotebookService:
             async with get_session() as session:
                 session.add(entry)
                 await session.flush()  # Get the ID assigned
-                await session.refresh(entry)
+
+                # Reload server-generated values; a plain refresh() would
+                # leave the deferred ai_metadata unloaded
+                await session.execute(
+                    select(NotebookEntry)
+                    .where(NotebookEntry.id == entry.id)
+                    .options(undefer(NotebookEntry.ai_metadata))
+                    .execution_options(populate_existing=True)
+                )
 
                 # Commit to Git if requested
                 if commit_to_git:
@@ -129,7 +140,11 @@ class NotebookService:
         """
         try:
             async with get_session() as session:
-                query = select(NotebookEntry).where(NotebookEntry.id == entry_id)
+                query = (
+                    select(NotebookEntry)
+                    .where(NotebookEntry.id == entry_id)
+                    .options(undefer(NotebookEntry.ai_metadata))
+                )
 
                 if include_feedback:
                     query = query.options(
@@ -141,7 +156,8 @@ class NotebookService:
                 entry = result.scalar_one_or_none()
 
                 if entry and increment_view_count:
-                    entry.view_count += 1
+                    view_count = await self._increment_view_count(session, entry_id)
+                    set_committed_value(entry, "view_count", view_count)
                     await session.commit()
 
                 return entry
@@ -150,6 +166,30 @@ class NotebookService:
             logger.error(f"Failed to get notebook entry {entry_id}: {e}")
             return None
 
+    async def _increment_view_count(self, session: AsyncSession, entry_id: str) -> int:
+        """
+        Atomically bump an entry's view counter with a single upsert.
+
+        Args:
+            session: Active database session
+            entry_id: Entry identifier
+
+        Returns:
+            The new view count
+        """
+        insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            insert(EntryViewCount)
+            .values(entry_id=entry_id, count=1)
+            .on_conflict_do_update(
+                index_elements=[EntryViewCount.entry_id],
+                set_={"count": EntryViewCount.count + 1}
+            )
+            .returning(EntryViewCount.count)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
     async def update_entry(
         self,
         entry_id: str,
@@ -174,7 +214,9 @@ class NotebookService:
         """
         try:
             async with get_session() as session:
-                entry = await session.get(NotebookEntry, entry_id)
+                entry = await session.get(
+                    NotebookEntry, entry_id, options=[undefer(NotebookEntry.ai_metadata)]
+                )
                 if not entry:
                     return None
 
@@ -188,7 +230,6 @@ class NotebookService:
 
                 # Update computed fields
                 entry.update_total_time()
-                entry.updated_at = datetime.now()
 
                 await session.flush()
 
@@ -275,8 +316,8 @@ class NotebookService:
         """
         try:
             async with get_session() as session:
-                # Build base query
-                base_query = select(NotebookEntry)
+                # Build base query; entries are handed back whole, so load ai_metadata
+                base_query = select(NotebookEntry).options(undefer(NotebookEntry.ai_metadata))
                 count_query = select(func.count(NotebookEntry.id))
 
                 # Add text search conditions
@@ -351,6 +392,7 @@ class NotebookService:
             async with get_session() as session:
                 query = (
                     select(NotebookEntry)
+                    .options(undefer(NotebookEntry.ai_metadata))
                     .where(
                         and_(
                             NotebookEntry.date >= start_date,
@@ -382,6 +424,7 @@ class NotebookService:
             async with get_session() as session:
                 query = (
                     select(NotebookEntry)
+                    .options(undefer(NotebookEntry.ai_metadata))
                     .order_by(desc(NotebookEntry.created_at))
                     .limit(limit)
                 )
@@ -409,6 +452,7 @@ class NotebookService:
                 # Use JSON operator to check if tag exists in tags array
                 query = (
                     select(NotebookEntry)
+                    .options(undefer(NotebookEntry.ai_metadata))
                     .where(func.json_extract_path_text(NotebookEntry.tags, '$').like(f'%"{tag}"%'))
                     .order_by(desc(NotebookEntry.date))
                     .limit(limit)
@@ -444,7 +488,9 @@ class NotebookService:
         """
         try:
             async with get_session() as session:
-                entry = await session.get(NotebookEntry, entry_id)
+                entry = await session.get(
+                    NotebookEntry, entry_id, options=[undefer(NotebookEntry.ai_metadata)]
+                )
                 if not entry:
                     return False
 
@@ -453,7 +499,6 @@ class NotebookService:
                     observation["at"] = datetime.now().isoformat()
 
                 entry.add_observation(observation)
-                entry.updated_at = datetime.now()
 
                 await session.flush()
 
@@ -490,16 +535,15 @@ class NotebookService:
         """
         try:
             async with get_session() as session:
-                entry = await session.get(NotebookEntry, entry_id)
+                entry = await session.get(
+                    NotebookEntry, entry_id, options=[undefer(NotebookEntry.ai_metadata)]
+                )
                 if not entry:
                     return False
 
-                # Merge with existing outcomes
-                if not entry.outcomes:
-                    entry.outcomes = {}
-
-                entry.outcomes.update(outcomes)
-                entry.updated_at = datetime.now()
+                # Merge into a new dict so the change is flushed and
+                # rating_10 is kept in sync
+                entry.outcomes = {**(entry.outcomes or {}), **outcomes}
 
                 await session.flush()
 
@@ -539,17 +583,8 @@ class NotebookService:
                     .order_by(func.count(NotebookEntry.id).desc())
                 )
 
-                # Average ratings from outcomes
-                avg_rating_result = await session.execute(
-                    select(func.avg(
-                        func.cast(
-                            func.json_extract_path_text(NotebookEntry.outcomes, 'rating_10'),
-                            'float'
-                        )
-                    ))
-                    .where(NotebookEntry.outcomes.isnot(None))
-                )
-                avg_rating = avg_rating_result.scalar()
+                # Average ratings (AVG skips entries without one)
+                avg_rating = await session.scalar(select(func.avg(NotebookEntry.rating_10)))
 
                 # Difficulty distribution
                 difficulty_dist = await session.execute(
@@ -699,9 +734,7 @@ class NotebookService:
             conditions.append(NotebookEntry.date <= filters["date_to"])
 
         if "has_rating" in filters and filters["has_rating"]:
-            conditions.append(
-                func.json_extract_path_text(NotebookEntry.outcomes, 'rating_10').isnot(None)
-            )
+            conditions.append(NotebookEntry.rating_10.isnot(None))
 
         return conditions
 
@@ -18,9 +18,9 @@ from dataclasses import dataclass
 
 from sqlalchemy import select, and_, or_, func, desc, asc, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
-from ..models import NotebookEntry, get_session
+from ..models import NotebookEntry, read_session
 from ..utils.config import get_settings
 from ..utils.logging import get_logger
 
@@ -142,9 +142,9 @@ class SearchService:
     ) -> Tuple[List[SearchResult], int]:
         """Execute the actual search query."""
         try:
-            async with get_session() as session:
-                # Build base query
-                base_query = select(NotebookEntry)
+            async with read_session() as session:
+                # Build base query; results carry whole entries, so load ai_metadata
+                base_query = select(NotebookEntry).options(undefer(NotebookEntry.ai_metadata))
                 count_query = select(func.count(NotebookEntry.id))
 
                 # Add search conditions
@@ -570,7 +570,7 @@ class SearchService:
             List of (tag, count) tuples sorted by popularity
         """
         try:
-            async with get_session() as session:
+            async with read_session() as session:
                 # This is a simplified approach - in production you might want
                 # to use a proper tag aggregation table
                 result = await session.execute(
@@ -617,7 +617,7 @@ class SearchService:
             suggestions = set()
             prefix_lower = query_prefix.lower()
 
-            async with get_session() as session:
+            async with read_session() as session:
                 # Get matching titles
                 result = await session.execute(
                     select(NotebookEntry.title)
@@ -6,7 +6,6 @@ conversation tracking, and integration with the cooking lab notebook system.
 """
 
 import re
-import hashlib
 import json
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
@@ -17,7 +16,7 @@ from aiohttp import ClientError
 from ..utils.config import get_settings
 from ..utils.logging import get_logger
 from ..services.mcp_server import MCPServer
-from ..services.feedback_service import FeedbackService, FeedbackChannel
+from ..services.feedback_service import FeedbackService, FeedbackChannel, pseudonymize
 
 
 logger = get_logger(__name__)
@@ -173,7 +172,7 @@ class SignalService:
             message_text = message_text.strip().lower()
 
             # Hash phone number for privacy
-            user_id = hashlib.sha256(from_number.encode()).hexdigest()[:12]
+            user_id = pseudonymize(from_number)
 
             logger.info(f"Processing Signal message from {user_id}: {message_text[:50]}...")
 
@@ -6,7 +6,6 @@ and integration with the cooking lab notebook system.
 """
 
 import re
-import hashlib
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
@@ -16,7 +15,7 @@ from twilio.base.exceptions import TwilioException
 from ..utils.config import get_settings
 from ..utils.logging import get_logger
 from ..services.mcp_server import MCPServer
-from ..services.feedback_service import FeedbackService, FeedbackChannel
+from ..services.feedback_service import FeedbackService, FeedbackChannel, pseudonymize
 
 
 logger = get_logger(__name__)
@@ -122,7 +121,7 @@ class SMSService:
             message_text = message_body.strip().lower()
 
             # Hash phone number for privacy
-            user_id = hashlib.sha256(from_number.encode()).hexdigest()[:12]
+            user_id = pseudonymize(from_number)
 
             logger.info(f"Processing SMS from {user_id}: {message_text[:30]}...")
 
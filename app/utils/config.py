@@ -8,7 +8,7 @@ validation, and configuration with proper defaults and security practices.
 import os
 from pathlib import Path
 from typing import Optional, Literal
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings
 from pydantic.networks import AnyHttpUrl
 from pydantic import ValidationInfo
@@ -115,6 +115,22 @@ class AuthSettings(BaseSettings):
         le=1440  # Max 24 hours
     )
 
+    # Decoded JWT claims are cached briefly so a client's back-to-back
+    # requests do not each pay for signature verification
+    token_cache_size: int = Field(
+        default=10_000,
+        env="TOKEN_CACHE_SIZE",
+        description="Maximum number of verified tokens kept in memory (0 disables)",
+        ge=0
+    )
+
+    token_cache_ttl: float = Field(
+        default=5.0,
+        env="TOKEN_CACHE_TTL",
+        description="Seconds a verified token is trusted without re-verification",
+        ge=0
+    )
+
     # Rate limiting
     rate_limit_requests: int = Field(
         default=100,
@@ -130,6 +146,17 @@ class AuthSettings(BaseSettings):
         ge=1
     )
 
+    # When a reverse proxy already limits requests, e.g. NGINX with
+    #   limit_req_zone $binary_remote_addr zone=family:1m rate=120r/m;
+    #   limit_req zone=family burst=20 nodelay;
+    # (or the nginx.ingress.kubernetes.io/rate-limit annotations in k8s/),
+    # the in-process RateLimitMiddleware is not installed at all.
+    use_proxy_rate_limit: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("USE_PROXY_RATE_LIMIT", "AUTH_USE_PROXY_RATE_LIMIT"),
+        description="Rely on the reverse proxy for rate limiting"
+    )
+
     # CORS settings
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:8000"],
@@ -499,6 +526,27 @@ class AppSettings(BaseSettings):
         description="Request timeout in seconds"
     )
 
+    # Routes whose bodies go through full pydantic validation get a tighter
+    # cap, bounding the validation work a single request can cause
+    validation_max_body_size: int = Field(
+        default=1024 * 1024,  # 1MB
+        env="VALIDATION_MAX_BODY_SIZE",
+        description="Maximum request size in bytes for validated endpoints"
+    )
+
+    validation_endpoints: list[str] = Field(
+        default=["/mcp", "/feedback"],
+        env="VALIDATION_ENDPOINTS",
+        description="Path prefixes subject to validation_max_body_size"
+    )
+
+    @field_validator('validation_endpoints', mode='before')
+    @classmethod
+    def parse_validation_endpoints(cls, v):
+        if isinstance(v, str):
+            return [prefix.strip() for prefix in v.split(',') if prefix.strip()]
+        return v
+
     @field_validator('debug', mode='before')
     @classmethod
     def parse_debug(cls, v):
@@ -639,7 +687,13 @@ settings = Settings()
 
 
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """
+    Get application settings instance.
+
+    Returns the process-wide instance built at import time, so this is as
+    cheap as an lru_cache lookup; callers on hot paths should still read the
+    values they need once at setup rather than per request.
+    """
     return settings
 
 
@@ -17,8 +17,9 @@ from datetime import datetime, timezone
 import traceback
 
 from loguru import logger as loguru_logger
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .config import get_settings
 
@@ -155,40 +156,57 @@ def setup_logging() -> None:
         )
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests with correlation IDs and metrics."""
+class RequestLoggingMiddleware:
+    """
+    Middleware for logging HTTP requests with correlation IDs and metrics.
 
-    async def dispatch(self, request: Request, call_next):
+    Implemented as pure ASGI middleware: the downstream app runs in the same
+    task (so the correlation ID context variable reaches it) and the response
+    is not re-streamed through BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging and timing."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
         # Generate correlation ID
         correlation_id = str(uuid.uuid4())
         correlation_id_var.set(correlation_id)
 
-        # Add correlation ID to request headers for downstream services
+        # Add correlation ID to request state for downstream handlers
         request.state.correlation_id = correlation_id
 
         # Start timing
         start_time = time.time()
+        status_code = None
+        process_time = None
 
         # Log request start
         await self._log_request_start(request, correlation_id)
 
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
-
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
-            response.headers["X-Correlation-ID"] = correlation_id
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time = time.time() - start_time
+                status_code = message["status"]
 
-            # Log successful response
-            await self._log_request_end(request, response, process_time, correlation_id)
-
-            return response
+                # Add timing and correlation headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(process_time)
+                headers["X-Correlation-ID"] = correlation_id
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Calculate processing time for error
             process_time = time.time() - start_time
@@ -199,6 +217,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             # Re-raise exception
             raise
 
+        # Log successful response
+        if status_code is not None:
+            await self._log_request_end(request, status_code, process_time, correlation_id)
+
     async def _log_request_start(self, request: Request, correlation_id: str):
         """Log request start with details."""
         # Extract client info
@@ -225,7 +247,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def _log_request_end(
         self,
         request: Request,
-        response: Response,
+        status_code: int,
         process_time: float,
         correlation_id: str
     ):
@@ -238,7 +260,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             method=request.method,
             url=str(request.url),
             path=request.url.path,
-            status_code=response.status_code,
+            status_code=status_code,
             process_time_ms=round(process_time * 1000, 2),
             user_id=user_id,
             correlation_id=correlation_id,
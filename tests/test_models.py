@@ -5,20 +5,56 @@ Validates SQLAlchemy models, database connections, and async operations.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import (
     Base,
     NotebookEntry,
-    FeedbackEntry,
-    MCPResource,
-    MCPTool,
+    User,
+    Feedback,
+    FeedbackChannel,
+    FeedbackStatus,
+    DatabaseManager,
     init_database,
     close_database
 )
 
 
+@pytest_asyncio.fixture
+async def model_session():
+    """Session on a fresh in-memory SQLite database set up by DatabaseManager."""
+    manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    await manager.initialize()
+    await manager.create_tables()
+    async with manager.get_session() as session:
+        yield session
+    await manager.close()
+
+
+async def add_feedback_rows(session: AsyncSession, count: int) -> list:
+    """Add an entry, a user and ``count`` pending feedback rows for them."""
+    now = datetime.now(timezone.utc)
+    session.add(NotebookEntry(id="2024-01-15_test-recipe", title="Test Recipe", date=now))
+    user = User(display_name="Tester")
+    session.add(user)
+    await session.flush()
+    rows = [
+        Feedback(
+            entry_id="2024-01-15_test-recipe",
+            user_id=user.id,
+            channel=FeedbackChannel.SMS,
+            feedback_timestamp=now,
+            rating_10=8,
+        )
+        for _ in range(count)
+    ]
+    session.add_all(rows)
+    await session.flush()
+    return rows
+
+
 class TestDatabaseModels:
     """Test suite for database models."""
 
@@ -393,4 +429,95 @@ class TestDatabaseOperations:
                 )
             )
             entries = result.scalars().all()
-            assert len(entries) == 5
\ No newline at end of file
+            assert len(entries) == 5
+
+
+class TestFeedbackStatusUpdates:
+    """Test suite for feedback status transitions."""
+
+    @pytest.mark.asyncio
+    async def test_mark_completed_refreshes_updated_at(self, model_session: AsyncSession):
+        """The trigger-stamped updated_at is visible on the instance after flush."""
+        feedback, = await add_feedback_rows(model_session, 1)
+        await model_session.execute(text("UPDATE feedback SET updated_at = '2000-01-01 00:00:00'"))
+        await model_session.refresh(feedback)
+        assert feedback.updated_at.year == 2000
+
+        feedback.mark_completed()
+        await model_session.flush()
+
+        assert feedback.status == FeedbackStatus.COMPLETED
+        assert feedback.updated_at.year > 2000
+
+    @pytest.mark.asyncio
+    async def test_mark_error_increments_retry_count(self, model_session: AsyncSession):
+        """mark_error records the message and counts the retry."""
+        feedback, = await add_feedback_rows(model_session, 1)
+
+        feedback.mark_error("parse failed")
+        await model_session.flush()
+
+        assert feedback.status == FeedbackStatus.ERROR
+        assert feedback.error_message == "parse failed"
+        assert feedback.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mark_completed_by_ids(self, model_session: AsyncSession):
+        """Only the listed rows are marked, in one UPDATE."""
+        rows = await add_feedback_rows(model_session, 3)
+        marked = [rows[0].id, rows[1].id]
+
+        assert await Feedback.mark_completed_by_ids(model_session, marked) == 2
+
+        result = await model_session.execute(select(Feedback.id, Feedback.status))
+        statuses = dict(result.all())
+        assert statuses[rows[0].id] == FeedbackStatus.COMPLETED
+        assert statuses[rows[1].id] == FeedbackStatus.COMPLETED
+        assert statuses[rows[2].id] == FeedbackStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_mark_error_by_ids(self, model_session: AsyncSession):
+        """retry_count is incremented in SQL and the message stored."""
+        rows = await add_feedback_rows(model_session, 2)
+        ids = [row.id for row in rows]
+
+        assert await Feedback.mark_error_by_ids(model_session, ids, "timeout") == 2
+        assert await Feedback.mark_error_by_ids(model_session, ids[:1], "timeout again") == 1
+
+        result = await model_session.execute(
+            select(Feedback.id, Feedback.status, Feedback.retry_count, Feedback.error_message)
+        )
+        by_id = {row.id: row for row in result}
+        assert by_id[ids[0]].retry_count == 2
+        assert by_id[ids[0]].error_message == "timeout again"
+        assert by_id[ids[1]].retry_count == 1
+        assert by_id[ids[1]].status == FeedbackStatus.ERROR
+
+
+class TestSessionBehaviour:
+    """Test suite for DatabaseManager session settings."""
+
+    @pytest.mark.asyncio
+    async def test_queries_see_pending_objects(self, model_session: AsyncSession):
+        """Write sessions autoflush, so services can query what they just added."""
+        model_session.add(NotebookEntry(
+            id="2024-01-15_pending", title="Pending", date=datetime.now(timezone.utc)
+        ))
+
+        result = await model_session.execute(
+            select(NotebookEntry).where(NotebookEntry.id == "2024-01-15_pending")
+        )
+        assert result.scalar_one_or_none() is not None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_reads_keep_isolation_level(self):
+        """Read sessions must not switch SQLite's shared connection to autocommit."""
+        manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        await manager.initialize()
+        try:
+            assert manager.read_session_maker is manager.session_maker
+            async with manager.read_session() as session:
+                connection = await session.connection()
+                assert await connection.get_isolation_level() != "AUTOCOMMIT"
+        finally:
+            await manager.close()
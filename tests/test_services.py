@@ -1 +1,79 @@
-# Tests for service layer
\ No newline at end of file
+"""
+Tests for the service layer.
+
+Covers helpers whose behaviour must stay stable across releases.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+
+from app.models import init_database, close_database
+from app.services.feedback_service import pseudonymize
+from app.services.notebook_service import NotebookService
+from app.services.search_service import SearchService
+
+
+@pytest_asyncio.fixture
+async def notebook_service():
+    """NotebookService on a fresh in-memory database holding one entry."""
+    await init_database("sqlite+aiosqlite:///:memory:")
+    service = NotebookService()
+    entry = await service.create_entry(
+        {"title": "Smoked Brisket", "date": datetime(2024, 11, 17, tzinfo=timezone.utc)},
+        commit_to_git=False,
+    )
+    await service.update_entry(
+        entry.id,
+        {"ai_metadata": {"similarity_scores": [{"entry_id": "2024-11-10_pulled-pork", "score": 0.9}]}},
+        commit_to_git=False,
+    )
+    yield service
+    await close_database()
+
+
+class TestPseudonymize:
+    """Test suite for sender pseudonymization."""
+
+    def test_matches_stored_user_ids(self):
+        """User IDs already stored were derived from a truncated SHA-256."""
+        sender = "+15551234567"
+        assert pseudonymize(sender) == hashlib.sha256(sender.encode()).hexdigest()[:12]
+
+    def test_is_stable_per_sender(self):
+        """The same sender always maps to the same 12-character ID."""
+        assert pseudonymize("cook@example.com") == pseudonymize("cook@example.com")
+        assert pseudonymize("cook@example.com") != pseudonymize("chef@example.com")
+        assert len(pseudonymize("cook@example.com")) == 12
+
+
+class TestEntryListings:
+    """Test suite for queries that hand back whole notebook entries."""
+
+    @pytest.mark.asyncio
+    async def test_listings_load_ai_metadata(self, notebook_service: NotebookService):
+        """ai_metadata is deferred, so listings must load it for callers."""
+        found, _ = await notebook_service.search_entries("")
+        listings = [
+            found,
+            await notebook_service.get_recent_entries(),
+            await notebook_service.get_entries_by_date_range(
+                datetime(2024, 11, 1, tzinfo=timezone.utc),
+                datetime(2024, 11, 30, tzinfo=timezone.utc),
+            ),
+        ]
+
+        for entries in listings:
+            assert len(entries) == 1
+            assert entries[0].to_dict(include_ai_metadata=True)["ai_metadata"]
+            assert entries[0].get_similarity_scores()[0]["score"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_search_results_load_ai_metadata(self, notebook_service: NotebookService):
+        """Search results carry the whole entry, ai_metadata included."""
+        results, total = await SearchService().search_entries("")
+
+        assert total == 1
+        assert results[0].entry.get_similarity_scores()[0]["score"] == 0.9